@@ -1,13 +1,13 @@
 """Interactive CLI for podcast generation."""
 
 import argparse
+import functools
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import beaupy
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
@@ -16,7 +16,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from groupchat_podcast import __version__
 from groupchat_podcast.contacts import build_contact_lookup, find_contact_dbs, resolve_participants
 from groupchat_podcast.imessage import DEFAULT_DB_PATH, GroupChat, extract_messages, list_group_chats
-from groupchat_podcast.podcast import PodcastGenerator
+from groupchat_podcast.podcast import PodcastGenerator, TTSCache
 from groupchat_podcast.preflight import run_preflight
 from groupchat_podcast.tts import TTSClient
 
@@ -70,12 +70,26 @@ def build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Skip preflight prerequisite checks",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Regenerate all audio instead of reusing previously generated clips",
+    )
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load the .env file into the environment, at most once per process."""
+    load_dotenv()
+
+
 def get_api_key() -> str:
     """Get ElevenLabs API key from environment or prompt."""
-    load_dotenv()
+    import beaupy
+
+    _load_env_once()
     api_key = os.getenv("ELEVENLABS_API_KEY")
 
     if not api_key:
@@ -91,6 +105,8 @@ def get_api_key() -> str:
 
 def select_group_chat(db_path: Path, page_size: int = 10) -> int:
     """Interactive group chat selection with pagination."""
+    import beaupy
+
     console.print("\n[bold]Scanning for group chats...[/bold]")
 
     try:
@@ -123,6 +139,8 @@ def select_group_chat(db_path: Path, page_size: int = 10) -> int:
 
 def get_date_range() -> Tuple[datetime, datetime]:
     """Interactive date range selection with optional time."""
+    import beaupy
+
     console.print("\n[bold]Date Range[/bold]")
     console.print("[dim]Format: YYYY-MM-DD or YYYY-MM-DD HH:MM[/dim]")
 
@@ -189,6 +207,8 @@ def _looks_like_voice_id(text: str) -> bool:
 
 def _search_and_select_voice(tts_client: TTSClient, query: str):
     """Search for voices and let user pick one. Returns Voice or None."""
+    import beaupy
+
     try:
         voices = tts_client.search_voices(query)
     except Exception as e:
@@ -216,6 +236,8 @@ def assign_voices(
     display_names: Optional[Dict[str, str]] = None,
 ) -> Dict[str, str]:
     """Interactive voice assignment for participants."""
+    import beaupy
+
     console.print("\n[bold]Voice Assignment[/bold]")
     console.print("Search for a voice by name, or paste a voice ID directly.\n")
 
@@ -261,6 +283,8 @@ def assign_voices(
 
 def get_output_path() -> Path:
     """Get output file path from user."""
+    import beaupy
+
     default_name = f"podcast_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
 
     path_str = beaupy.prompt("Output file path", initial_value=default_name)
@@ -284,6 +308,8 @@ def show_cost_estimate(
     end_date: datetime,
 ) -> bool:
     """Show cost estimate and confirm generation."""
+    import beaupy
+
     estimate = generator.estimate_cost(db_path, chat_id, start_date, end_date)
 
     panel = Panel(
@@ -341,6 +367,11 @@ def run_generation(
 
 def main():
     """Main CLI entry point."""
+    # Fast path: answer --version without building the parser
+    if sys.argv[1:2] == ["--version"]:
+        print(f"groupchat-podcast {__version__}")
+        sys.exit(0)
+
     try:
         args = build_parser().parse_args()
 
@@ -448,7 +479,11 @@ def main():
             output_path = get_output_path()
 
         # Create generator
-        generator = PodcastGenerator(tts_client=tts_client, voice_map=voice_map)
+        generator = PodcastGenerator(
+            tts_client=tts_client,
+            voice_map=voice_map,
+            tts_cache=None if args.no_cache else TTSCache(),
+        )
 
         # Show estimate and confirm
         if not show_cost_estimate(generator, db_path, chat_id, start_date, end_date):
@@ -3,6 +3,7 @@
 import functools
 import re
 import sqlite3
+import sys
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
@@ -16,6 +17,9 @@ MAC_EPOCH_UTC = datetime(2001, 1, 1, tzinfo=timezone.utc)
 # Default database path
 DEFAULT_DB_PATH = Path.home() / "Library" / "Messages" / "chat.db"
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class GroupChat:
@@ -28,9 +32,13 @@ class GroupChat:
     last_message_date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Message:
-    """Represents an iMessage message."""
+    """Represents an iMessage message.
+
+    Immutable, and slotted where supported, since chats can hold tens of
+    thousands of them; use dataclasses.replace() to derive a modified copy.
+    """
 
     sender: str
     text: Optional[str]
@@ -45,8 +53,7 @@ def convert_mac_timestamp(mac_timestamp: int) -> datetime:
     """Convert Mac nanosecond timestamp (UTC) to local datetime."""
     if mac_timestamp == 0:
         return MAC_EPOCH_UTC.astimezone().replace(tzinfo=None)
-    seconds = mac_timestamp / 1_000_000_000
-    utc_dt = MAC_EPOCH_UTC + timedelta(seconds=seconds)
+    utc_dt = MAC_EPOCH_UTC + timedelta(microseconds=mac_timestamp // 1000)
     return utc_dt.astimezone().replace(tzinfo=None)
 
 
@@ -59,7 +66,8 @@ def datetime_to_mac_timestamp(dt: datetime) -> int:
         dt = dt.astimezone()
     utc_dt = dt.astimezone(timezone.utc)
     delta = utc_dt - MAC_EPOCH_UTC
-    return int(delta.total_seconds() * 1_000_000_000)
+    # Integer math keeps nanoseconds exact; a float of total_seconds() can't
+    return delta.days * 86_400_000_000_000 + delta.seconds * 1_000_000_000 + delta.microseconds * 1000
 
 
 def parse_attributed_body(blob: Optional[bytes]) -> str:
@@ -1,25 +1,46 @@
 """Podcast generation and audio stitching module."""
 
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import subprocess
 import tempfile
-from datetime import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-
-from pydub import AudioSegment
+from typing import Any, Callable, Dict, FrozenSet, Generator, List, Optional, Tuple
 
 from groupchat_podcast.imessage import Message, extract_messages
 from groupchat_podcast.tts import TTSClient, preprocess_text_for_tts
 
+# Trailing punctuation after which merged texts are joined with a space, not a comma
+_PUNCT_END = (".", "!", "?", ":", ";")
+
+# Default location for cached TTS audio
+DEFAULT_TTS_CACHE_DIR = Path.home() / ".cache" / "groupchat_podcast" / "tts"
+
+
+def _smart_join(parts: List[str]) -> str:
+    """Join texts with comma or space depending on trailing punctuation.
 
-def _smart_join(existing: str, new: str) -> str:
-    """Join two texts with comma or space depending on trailing punctuation."""
-    if not existing:
-        return new
-    if not new:
-        return existing
-    if existing[-1] in ".!?":
-        return existing + " " + new
-    return existing + ", " + new
+    Trailing whitespace is stripped from each part so separators never
+    double up, and empty parts are skipped. Builds the result in a single
+    join, so merging a long run costs O(total length) rather than re-copying
+    on every append.
+    """
+    pieces: List[str] = []
+    for part in parts:
+        part = part.rstrip()
+        if not part:
+            continue
+        if pieces:
+            pieces.append(" " if pieces[-1].endswith(_PUNCT_END) else ", ")
+        pieces.append(part)
+    return "".join(pieces)
 
 
 def merge_consecutive_messages(
@@ -44,20 +65,21 @@ def merge_consecutive_messages(
 
     result: List[Message] = []
     current = messages[0]
-    merged_text = current.text or ""
+    run_texts = [current.text or ""]
     has_any_attachment = current.has_attachment
+    # Compare timedeltas directly rather than converting each gap to float seconds
+    max_gap = timedelta(seconds=max_gap_seconds)
 
     for i in range(1, len(messages)):
         msg = messages[i]
-        gap = (msg.timestamp - messages[i - 1].timestamp).total_seconds()
 
-        if msg.sender == current.sender and gap <= max_gap_seconds:
-            merged_text = _smart_join(merged_text, msg.text or "")
+        if msg.sender == current.sender and msg.timestamp - messages[i - 1].timestamp <= max_gap:
+            run_texts.append(msg.text or "")
             has_any_attachment = has_any_attachment or msg.has_attachment
         else:
             result.append(Message(
                 sender=current.sender,
-                text=merged_text,
+                text=_smart_join(run_texts),
                 timestamp=current.timestamp,
                 guid=current.guid,
                 thread_originator_guid=current.thread_originator_guid,
@@ -65,13 +87,13 @@ def merge_consecutive_messages(
                 attachment_type=current.attachment_type,
             ))
             current = msg
-            merged_text = msg.text or ""
+            run_texts = [msg.text or ""]
             has_any_attachment = msg.has_attachment
 
     # Append the last run
     result.append(Message(
         sender=current.sender,
-        text=merged_text,
+        text=_smart_join(run_texts),
         timestamp=current.timestamp,
         guid=current.guid,
         thread_originator_guid=current.thread_originator_guid,
@@ -82,55 +104,622 @@ def merge_consecutive_messages(
     return result
 
 
+def _find_ffmpeg_tool(name: str) -> Optional[str]:
+    """Locate an ffmpeg tool on PATH or in the Homebrew prefixes preflight accepts."""
+    found = shutil.which(name)
+    if found:
+        return found
+    for prefix in ("/opt/homebrew/bin", "/usr/local/bin"):
+        candidate = os.path.join(prefix, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+# Resolved once per process instead of walking PATH on every call
+_FFMPEG_PATH = _find_ffmpeg_tool("ffmpeg")
+_FFPROBE_PATH = _find_ffmpeg_tool("ffprobe")
+
+
+def _run_ffmpeg_tool(args: List[str]) -> str:
+    """Run an ffmpeg/ffprobe command and return its stdout.
+
+    Args:
+        args: Command line, starting with "ffmpeg" or "ffprobe"
+
+    Raises:
+        RuntimeError: If the tool is not installed or exits with an error
+    """
+    executable = _FFMPEG_PATH if args[0] == "ffmpeg" else _FFPROBE_PATH
+    if executable is None:
+        raise RuntimeError(f"{args[0]} not found")
+    result = subprocess.run([executable, *args[1:]], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def _probe_audio_format(path: Path) -> Tuple[int, int]:
+    """Get (sample_rate, channels) of the first audio stream in a file."""
+    output = _run_ffmpeg_tool([
+        "ffprobe", "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels",
+        "-of", "json",
+        str(path),
+    ])
+    stream = json.loads(output)["streams"][0]
+    return int(stream["sample_rate"]), int(stream["channels"])
+
+
+def _audio_format(path: Path) -> Tuple[int, int]:
+    """Get (sample_rate, channels) of an audio file, reading MP3 frame headers without ffprobe."""
+    parsed = _mp3_audio_frames(path.read_bytes())
+    if parsed is not None:
+        return parsed.stream_format
+    return _probe_audio_format(path)
+
+
+def _render_silence(path: Path, pause_ms: int, sample_rate: int, channels: int) -> None:
+    """Encode an MP3 of silence whose sample rate and channels match the segments."""
+    layout = "mono" if channels == 1 else "stereo"
+    _run_ffmpeg_tool([
+        "ffmpeg", "-y", "-v", "error",
+        "-f", "lavfi", "-i", f"anullsrc=r={sample_rate}:cl={layout}",
+        "-t", f"{pause_ms / 1000:.3f}",
+        "-c:a", "libmp3lame", "-q:a", "9",
+        str(path),
+    ])
+
+
+def _render_silence_like(segment: Path, path: Path, pause_ms: int) -> Path:
+    """Write a silence clip in the same audio format as segment and return its path.
+
+    MP3 segments get silent frames built in Python; anything else is probed
+    and rendered with ffmpeg.
+    """
+    parsed = _mp3_audio_frames(segment.read_bytes())
+    if parsed is not None:
+        path.write_bytes(_mp3_silence(pause_ms, parsed.header))
+    else:
+        _render_silence(path, pause_ms, *_probe_audio_format(segment))
+    return path
+
+
+def _concat_list_entry(path: Path) -> str:
+    """Format a path as a line of an ffmpeg concat demuxer list."""
+    # Inside single quotes, a literal ' is written as '\''
+    escaped = str(Path(path).absolute()).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+# MPEG audio Layer III header tables, keyed by the 2-bit version ID (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MP3_BITRATES_KBPS = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Return the length of the ID3v2 tag at the start of data, or 0 if there is none."""
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    size = 10 + ((data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F))
+    if data[5] & 0x10:
+        size += 10  # Footer present
+    return size
+
+
+@dataclass(frozen=True)
+class _MP3Audio:
+    """Bare Layer III audio frames split out of an MP3 file."""
+
+    header: bytes  # 4-byte header of the first audio frame
+    frame_count: int
+    bitrate_indices: FrozenSet[int]
+    frames: bytes
+
+    @property
+    def stream_format(self) -> Tuple[int, int]:
+        """(sample_rate, channels) of the frames."""
+        version, _, sample_rate_index, _, channel_mode = _mp3_header_fields(self.header)
+        return _MP3_SAMPLE_RATES[version][sample_rate_index], 1 if channel_mode == 3 else 2
+
+
+def _mp3_header_fields(header: bytes) -> Optional[Tuple[int, int, int, int, int]]:
+    """Decode a Layer III frame header.
+
+    Returns:
+        (version, bitrate_index, sample_rate_index, padding, channel_mode), or
+        None if header isn't a valid Layer III frame header
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x3
+    layer = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    return version, bitrate_index, sample_rate_index, (header[2] >> 1) & 1, header[3] >> 6
+
+
+def _mp3_frame_length(version: int, bitrate_index: int, sample_rate_index: int, padding: int) -> int:
+    """Size in bytes of a Layer III frame, header included."""
+    return (
+        (144 if version == 3 else 72) * _MP3_BITRATES_KBPS[version][bitrate_index] * 1000
+        // _MP3_SAMPLE_RATES[version][sample_rate_index]
+        + padding
+    )
+
+
+def _mp3_side_info_length(version: int, channel_mode: int) -> int:
+    """Size of the side info that follows a Layer III frame header."""
+    if version == 3:
+        return 17 if channel_mode == 3 else 32
+    return 9 if channel_mode == 3 else 17
+
+
+def _mp3_audio_frames(data: bytes) -> Optional[_MP3Audio]:
+    """Split an MP3 blob into its bare audio frames.
+
+    ID3 tags and a leading Xing/Info/VBRI header frame are dropped, since they
+    describe only this blob and would be wrong in the middle of a joined file.
+
+    Args:
+        data: Raw MP3 file contents
+
+    Returns:
+        The audio frames with their count and bitrates, or None if data isn't
+        a stream of Layer III frames in one sample rate and channel layout
+    """
+    start = _id3v2_size(data)
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128  # ID3v1 trailer
+
+    fields = _mp3_header_fields(data[start:start + 4])
+    if fields is None:
+        return None
+    version, bitrate_index, sample_rate_index, padding, channel_mode = fields
+
+    # Xing/Info sits right after the side info; VBRI at a fixed offset
+    tag_at = start + 4 + _mp3_side_info_length(version, channel_mode)
+    if data[tag_at:tag_at + 4] in (b"Xing", b"Info") or data[start + 36:start + 40] == b"VBRI":
+        start += _mp3_frame_length(version, bitrate_index, sample_rate_index, padding)
+
+    # Walk the frames to count them; anything unexpected goes to ffmpeg instead
+    frame_count = 0
+    bitrate_indices = set()
+    pos = start
+    while pos < end:
+        frame = _mp3_header_fields(data[pos:pos + 4])
+        if (
+            frame is None
+            or frame[0] != version
+            or frame[2] != sample_rate_index
+            or (frame[4] == 3) != (channel_mode == 3)
+        ):
+            return None
+        bitrate_indices.add(frame[1])
+        frame_count += 1
+        pos += _mp3_frame_length(*frame[:4])
+    if frame_count == 0:
+        return None
+
+    return _MP3Audio(
+        header=data[start:start + 4],
+        frame_count=frame_count,
+        bitrate_indices=frozenset(bitrate_indices),
+        frames=data[start:end],
+    )
+
+
+def _mp3_info_frame(header: bytes, frame_count: int, audio_bytes: int, cbr: bool) -> bytes:
+    """Build a Xing (VBR) or Info (CBR) header frame describing a whole stream.
+
+    Without one, players estimate the length of a joined file from the first
+    frame's bitrate, which is wrong whenever the bitrate changes.
+
+    Args:
+        header: Header of the stream's first audio frame
+        frame_count: Number of audio frames in the stream
+        audio_bytes: Size of the audio frames in bytes
+        cbr: Whether every audio frame has the same bitrate
+
+    Returns:
+        One Layer III frame to put in front of the audio frames
+    """
+    version, bitrate_index, sample_rate_index, _, channel_mode = _mp3_header_fields(header)
+    tag_at = 4 + _mp3_side_info_length(version, channel_mode)
+    # Tag, flags (frames and bytes fields present), frames, bytes
+    tag_len = 16
+    # Stay at the stream's bitrate unless the frame is too small for the tag
+    while _mp3_frame_length(version, bitrate_index, sample_rate_index, 0) < tag_at + tag_len:
+        bitrate_index += 1
+    frame_len = _mp3_frame_length(version, bitrate_index, sample_rate_index, 0)
+
+    frame = bytearray(frame_len)
+    frame[:4] = bytes((
+        0xFF,
+        0xE0 | version << 3 | 0x1 << 1 | 0x1,  # Layer III, no CRC
+        bitrate_index << 4 | sample_rate_index << 2,  # No padding
+        channel_mode << 6,
+    ))
+    frame[tag_at:tag_at + tag_len] = (
+        (b"Info" if cbr else b"Xing")
+        + (0x1 | 0x2).to_bytes(4, "big")
+        + frame_count.to_bytes(4, "big")
+        + (frame_len + audio_bytes).to_bytes(4, "big")
+    )
+    return bytes(frame)
+
+
+def _mp3_silence(pause_ms: int, header: bytes) -> bytes:
+    """Build pause_ms of digital silence as Layer III frames, without an encoder.
+
+    Each frame is a header followed by all-zero side info and main data, which
+    decodes to silence and doesn't draw on the bit reservoir of other frames.
+    The frames copy the given header's bitrate, padding and channel mode, so
+    silence between CBR segments keeps the joined stream CBR.
+
+    Args:
+        pause_ms: Length of the silence in milliseconds
+        header: Header of an audio frame from the segments to match
+
+    Returns:
+        Raw MP3 frames
+    """
+    version, bitrate_index, sample_rate_index, padding, channel_mode = _mp3_header_fields(header)
+    samples_per_frame = 1152 if version == 3 else 576
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    frame_count = max(1, round(pause_ms * sample_rate / (1000 * samples_per_frame)))
+
+    # No CRC, so the zeroed side info follows the header directly
+    silent_header = bytes((
+        0xFF,
+        0xE0 | version << 3 | 0x1 << 1 | 0x1,
+        bitrate_index << 4 | sample_rate_index << 2 | padding << 1,
+        channel_mode << 6,
+    ))
+    frame_len = _mp3_frame_length(version, bitrate_index, sample_rate_index, padding)
+    return (silent_header + bytes(frame_len - len(silent_header))) * frame_count
+
+
 def stitch_audio(
     segments: List[Path],
     output_path: Path,
     pause_ms: int = 500,
+    silence: Optional[Path] = None,
 ) -> None:
     """Stitch multiple audio segments into a single file with pauses.
 
+    MP3 segments that share a sample rate and channel count are joined by
+    concatenating their frames in memory, behind a Xing/Info frame that
+    records the joined stream's length. Anything else goes through ffmpeg's
+    concat demuxer in one pass: with stream copy when every segment shares a
+    sample rate and channel count, and re-encoded at the highest rate and
+    channel count among them when they differ, since the demuxer can't mix
+    stream parameters. Pauses come from a single silence clip rendered to
+    match the first segment's format.
+
     Args:
         segments: List of paths to audio files to concatenate
         output_path: Path to write the output file
         pause_ms: Milliseconds of silence between segments
+        silence: Pre-rendered pause clip matching the segments' format;
+                 rendered from the first segment when omitted
 
     Raises:
         ValueError: If segments list is empty
+        RuntimeError: If ffmpeg fails
     """
     if not segments:
         raise ValueError("Cannot stitch empty segment list")
 
-    # Create silence segment for pauses
-    silence = AudioSegment.silent(duration=pause_ms)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+
+        if _join_mp3_frames(segments, output_path, pause_ms, silence):
+            return
+
+        silence_entry = None
+        if pause_ms > 0 and len(segments) > 1:
+            if silence is None:
+                silence = _render_silence_like(segments[0], tmp_path / "silence.mp3", pause_ms)
+            silence_entry = _concat_list_entry(silence)
+
+        # Interleave segments with the shared silence clip (not after the last one)
+        entries = []
+        for i, segment_path in enumerate(segments):
+            if i > 0 and silence_entry:
+                entries.append(silence_entry)
+            entries.append(_concat_list_entry(segment_path))
+
+        list_path = tmp_path / "concat.txt"
+        list_path.write_text("".join(entries), encoding="utf-8")
+
+        formats = {_audio_format(path) for path in segments}
+        if len(formats) == 1:
+            codec_args = ["-c", "copy"]
+        else:
+            codec_args = [
+                "-c:a", "libmp3lame",
+                "-ar", str(max(rate for rate, _ in formats)),
+                "-ac", str(max(channels for _, channels in formats)),
+            ]
+
+        _run_ffmpeg_tool([
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_path),
+            *codec_args,
+            str(output_path),
+        ])
+
+
+def _join_mp3_frames(
+    segments: List[Path],
+    output_path: Path,
+    pause_ms: int,
+    silence: Optional[Path],
+) -> bool:
+    """Write segments to output_path as one frame-concatenated MP3 if they are compatible.
+
+    Returns:
+        True if the output was written, False if the segments need ffmpeg
+    """
+    contents = [path.read_bytes() for path in segments]
+    parsed = [_mp3_audio_frames(data) for data in contents]
+    if any(p is None for p in parsed) or len({p.stream_format for p in parsed}) != 1:
+        return False
+    stream_format = parsed[0].stream_format
+
+    silence_clip: Optional[_MP3Audio] = None
+    if pause_ms > 0 and len(segments) > 1:
+        if silence is not None:
+            silence_clip = _mp3_audio_frames(silence.read_bytes())
+        if silence_clip is None or silence_clip.stream_format != stream_format:
+            silence_clip = _mp3_audio_frames(_mp3_silence(pause_ms, parsed[0].header))
+
+    pieces = list(parsed)
+    frame_count = sum(p.frame_count for p in parsed)
+    separator = b""
+    if silence_clip is not None:
+        pieces.append(silence_clip)
+        frame_count += silence_clip.frame_count * (len(segments) - 1)
+        separator = silence_clip.frames
+    audio = separator.join(p.frames for p in parsed)
+    bitrates = frozenset().union(*(p.bitrate_indices for p in pieces))
+    info = _mp3_info_frame(parsed[0].header, frame_count, len(audio), cbr=len(bitrates) == 1)
+
+    # Keep the first segment's ID3v2 tag as the file's metadata
+    tag = contents[0][:_id3v2_size(contents[0])]
+    output_path.write_bytes(tag + info + audio)
+    return True
+
+
+class TTSCache:
+    """On-disk cache of synthesized audio, keyed by text, voice and TTS settings.
+
+    Entries are evicted least-recently-used first once the cache grows past
+    max_cache_mb. The cache's total size is tracked in memory after one
+    directory scan, so storing an entry doesn't stat every file.
+    """
+
+    # Evict down to this fraction of the limit, so a full cache isn't rescanned on every put
+    _EVICT_TO = 0.9
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_cache_mb: int = 500):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store audio in (defaults to DEFAULT_TTS_CACHE_DIR)
+            max_cache_mb: Size limit in megabytes before old entries are evicted
+        """
+        self._dir = Path(cache_dir) if cache_dir is not None else DEFAULT_TTS_CACHE_DIR
+        self._max_bytes = max_cache_mb * 1024 * 1024
+        # Running total of entry sizes; None until the first put scans the directory
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _path_for(self, text: str, voice_id: str, settings: str) -> Path:
+        """Get the cache file path for a text/voice/settings combination."""
+        # Collapse whitespace only: case can change how a phrase is spoken
+        normalized = " ".join(text.split())
+        key = hashlib.sha256(f"{normalized}|{voice_id}|{settings}".encode("utf-8")).hexdigest()
+        return self._dir / f"{key}.mp3"
+
+    def get(self, text: str, voice_id: str, settings: str = "") -> Optional[Path]:
+        """Look up cached audio.
+
+        Args:
+            text: Text that was synthesized
+            voice_id: Voice it was synthesized with
+            settings: Any other settings the audio depends on, such as
+                      TTSClient.cache_key()
+
+        Returns:
+            Path to the cached MP3, or None on a miss
+        """
+        path = self._path_for(text, voice_id, settings)
+        try:
+            # Mark as recently used; atime alone is unreliable on noatime mounts
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def copy_to(self, text: str, voice_id: str, dst: Path, settings: str = "") -> bool:
+        """Copy cached audio straight to dst without reading it into memory.
+
+        shutil.copyfile copies in the kernel where the OS allows it
+        (sendfile on Linux, fcopyfile on macOS).
+
+        Args:
+            text: Text that was synthesized
+            voice_id: Voice it was synthesized with
+            dst: Path to write the audio to
+            settings: Any other settings the audio depends on
+
+        Returns:
+            True on a cache hit, False on a miss
+        """
+        cached = self.get(text, voice_id, settings)
+        if cached is None:
+            return False
+        try:
+            shutil.copyfile(cached, dst)
+        except FileNotFoundError:
+            return False  # Evicted between lookup and copy
+        return True
+
+    def put(self, text: str, voice_id: str, audio_bytes: bytes, settings: str = "") -> Path:
+        """Store synthesized audio.
+
+        Args:
+            text: Text that was synthesized
+            voice_id: Voice it was synthesized with
+            audio_bytes: MP3 audio data
+            settings: Any other settings the audio depends on
+
+        Returns:
+            Path to the cached MP3
+        """
+        path = self._path_for(text, voice_id, settings)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(audio_bytes)
+
+        with self._size_lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp, path)
+            self._size += len(audio_bytes) - replaced
+            if self._size > self._max_bytes:
+                self._evict()
+        return path
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every cached entry."""
+        entries = []
+        for path in self._dir.glob("*.mp3"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by another process's eviction
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache is back under its size limit.
+
+        Rescans the directory, so entries written by other processes count too.
+        Must be called with _size_lock held.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        target = self._max_bytes * self._EVICT_TO
+
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
 
-    # Load and concatenate all segments
-    combined = AudioSegment.empty()
+def _segment_path(tmp_path: Path, index: int) -> Path:
+    """Path of the audio segment for the message at index."""
+    return tmp_path / f"segment_{index:05d}.mp3"
 
-    for i, segment_path in enumerate(segments):
-        audio = AudioSegment.from_mp3(segment_path)
-        combined += audio
 
-        # Add pause between segments (not after the last one)
-        if i < len(segments) - 1 and pause_ms > 0:
-            combined += silence
+def _stitch_segments(
+    segment_paths: List[Path], output_path: Path, pause_ms: int, silence: Optional[Path],
+) -> None:
+    """Stitch generated segments into the podcast.
+
+    Raises:
+        ValueError: If no segments were generated
+    """
+    if not segment_paths:
+        raise ValueError(
+            "No audio segments generated - check voice mappings"
+        )
+    stitch_audio(segment_paths, output_path, pause_ms, silence=silence)
 
-    # Export to output file
-    combined.export(output_path, format="mp3")
+
+def _contiguous_voice_runs(
+    jobs: List[Optional[Tuple[str, str]]], batch_size: int,
+) -> List[Tuple[str, List[int]]]:
+    """Group adjacent jobs that share a voice into runs of at most batch_size.
+
+    Args:
+        jobs: (text, voice_id) per message, or None for skipped messages
+        batch_size: Maximum number of jobs per run
+
+    Returns:
+        List of (voice_id, job indices) tuples in message order
+    """
+    runs: List[Tuple[str, List[int]]] = []
+    prev_voice = None
+    for j, job in enumerate(jobs):
+        if job is None:
+            prev_voice = None
+            continue
+        voice_id = job[1]
+        if voice_id == prev_voice and len(runs[-1][1]) < batch_size:
+            runs[-1][1].append(j)
+        else:
+            runs.append((voice_id, [j]))
+        prev_voice = voice_id
+    return runs
 
 
 class PodcastGenerator:
     """Orchestrates podcast generation from iMessage chats."""
 
-    def __init__(self, tts_client: TTSClient, voice_map: Dict[str, str]):
+    def __init__(
+        self,
+        tts_client: TTSClient,
+        voice_map: Dict[str, str],
+        tts_concurrency: int = 4,
+        tts_cache: Optional[TTSCache] = None,
+        batch_size: int = 8,
+    ):
         """Initialize the podcast generator.
 
         Args:
             tts_client: TTS client for generating audio
             voice_map: Mapping of sender IDs to voice IDs.
                        Use "_default" key for fallback voice.
+            tts_concurrency: Maximum number of TTS requests in flight at once
+            tts_cache: Optional cache to reuse audio for repeated text/voice pairs
+            batch_size: Maximum texts per request when the client provides
+                        generate_batch(texts, voice_ids); 1 disables batching
         """
         self._tts = tts_client
         self._voice_map = voice_map
+        self._tts_concurrency = tts_concurrency
+        self._tts_cache = tts_cache
+        self._batch_size = batch_size
+        # Keeps audio cached under other TTS settings from being reused
+        cache_key = getattr(type(tts_client), "cache_key", None)
+        self._cache_settings = cache_key(tts_client) if callable(cache_key) else ""
+
+    def _supports_batch(self) -> bool:
+        """Whether the TTS client can synthesize several texts in one request."""
+        # Looked up on the class so auto-attribute objects (mocks) don't count
+        return self._batch_size > 1 and callable(getattr(type(self._tts), "generate_batch", None))
 
     def _get_voice_id(self, sender: str) -> str:
         """Get the voice ID for a sender."""
@@ -138,6 +727,211 @@ class PodcastGenerator:
             return self._voice_map[sender]
         return self._voice_map.get("_default", "")
 
+    def _synthesize(self, text: str, voice_id: str) -> bytes:
+        """Generate audio for text, reusing cached audio when available."""
+        if self._tts_cache is None:
+            return self._tts.generate(text, voice_id)
+
+        cached = self._tts_cache.get(text, voice_id, self._cache_settings)
+        if cached is not None:
+            try:
+                return cached.read_bytes()
+            except OSError:
+                pass  # Evicted between lookup and read; regenerate
+
+        audio_bytes = self._tts.generate(text, voice_id)
+        self._tts_cache.put(text, voice_id, audio_bytes, self._cache_settings)
+        return audio_bytes
+
+    def _synthesize_to(self, text: str, voice_id: str, path: Path) -> None:
+        """Write audio for text to path, copying cached audio file-to-file on a hit."""
+        cache = self._tts_cache
+        if cache is not None and cache.copy_to(text, voice_id, path, self._cache_settings):
+            return
+
+        audio_bytes = self._tts.generate(text, voice_id)
+        path.write_bytes(audio_bytes)
+        if self._tts_cache is not None:
+            self._tts_cache.put(text, voice_id, audio_bytes, self._cache_settings)
+
+    async def _synthesize_async(self, text: str, voice_id: str) -> bytes:
+        """Async counterpart of _synthesize; sync clients run in a worker thread."""
+        if not callable(getattr(type(self._tts), "generate_async", None)):
+            return await asyncio.to_thread(self._synthesize, text, voice_id)
+
+        if self._tts_cache is not None:
+            cached = self._tts_cache.get(text, voice_id, self._cache_settings)
+            if cached is not None:
+                try:
+                    return cached.read_bytes()
+                except OSError:
+                    pass  # Evicted between lookup and read; regenerate
+
+        audio_bytes = await self._tts.generate_async(text, voice_id)
+        if self._tts_cache is not None:
+            self._tts_cache.put(text, voice_id, audio_bytes, self._cache_settings)
+        return audio_bytes
+
+    def _synthesize_batch(self, texts: List[str], voice_id: str) -> List[bytes]:
+        """Generate audio for several texts in one request, skipping cached ones.
+
+        Raises:
+            RuntimeError: If the client returns a different number of clips than texts
+        """
+        results: Dict[int, bytes] = {}
+        if self._tts_cache is not None:
+            for i, text in enumerate(texts):
+                cached = self._tts_cache.get(text, voice_id, self._cache_settings)
+                if cached is not None:
+                    try:
+                        results[i] = cached.read_bytes()
+                    except OSError:
+                        pass  # Evicted between lookup and read; regenerate
+
+        missing = [i for i in range(len(texts)) if i not in results]
+        if missing:
+            generated = self._tts.generate_batch(
+                [texts[i] for i in missing], [voice_id] * len(missing)
+            )
+            generated = list(generated)
+            if len(generated) != len(missing):
+                raise RuntimeError(
+                    f"generate_batch returned {len(generated)} clips for {len(missing)} texts"
+                )
+            for i, audio_bytes in zip(missing, generated):
+                results[i] = audio_bytes
+                if self._tts_cache is not None:
+                    self._tts_cache.put(texts[i], voice_id, audio_bytes, self._cache_settings)
+
+        return [results[i] for i in range(len(texts))]
+
+    def _prepare_jobs(
+        self,
+        db_path: Path,
+        chat_id: int,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Tuple[List[Message], List[Optional[Tuple[str, str]]]]:
+        """Load the messages to narrate and the TTS job for each one.
+
+        Returns:
+            Tuple of (merged messages, (text, voice_id) per message); a job is
+            None when the sender has no voice and the message is skipped
+
+        Raises:
+            ValueError: If there are no messages with text in the range
+        """
+        # Extract messages
+        messages = extract_messages(db_path, chat_id, start_date, end_date)
+
+        # Filter out empty messages
+        messages = [m for m in messages if m.text and m.text.strip()]
+
+        if not messages:
+            raise ValueError("No messages to generate podcast from")
+
+        # Merge consecutive same-sender messages
+        messages = merge_consecutive_messages(messages)
+
+        jobs: List[Optional[Tuple[str, str]]] = []
+        for message in messages:
+            # Get voice for this sender
+            voice_id = self._get_voice_id(message.sender)
+            if not voice_id:
+                import warnings
+                warnings.warn(
+                    f"No voice mapped for sender '{message.sender}' and no _default - skipping"
+                )
+                jobs.append(None)
+                continue
+
+            # Preprocess text for TTS
+            jobs.append((preprocess_text_for_tts(message.text), voice_id))
+
+        return messages, jobs
+
+    def _start_requests(
+        self,
+        jobs: List[Optional[Tuple[str, str]]],
+        start_one: Callable[[int, str, str], Any],
+        start_batch: Callable[[List[str], str], Any],
+    ) -> Tuple[List[Any], List[Optional[Tuple[Any, Optional[int]]]]]:
+        """Start every TTS request up front: one per job, or one per same-voice run when batching.
+
+        Args:
+            jobs: (text, voice_id) per message, or None for skipped messages
+            start_one: Starts a request for (job index, text, voice_id) and returns its handle
+            start_batch: Starts a request for (texts, voice_id) and returns its handle
+
+        Returns:
+            Tuple of (every request handle, per message either None or
+            (handle, index into the batch's results or None for a single request))
+        """
+        handles: List[Any] = []
+        slots: List[Optional[Tuple[Any, Optional[int]]]] = [None] * len(jobs)
+        if self._supports_batch():
+            for voice_id, indices in _contiguous_voice_runs(jobs, self._batch_size):
+                handle = start_batch([jobs[j][0] for j in indices], voice_id)
+                handles.append(handle)
+                for pos, j in enumerate(indices):
+                    slots[j] = (handle, pos)
+        else:
+            for j, job in enumerate(jobs):
+                if job is not None:
+                    handle = start_one(j, *job)
+                    handles.append(handle)
+                    slots[j] = (handle, None)
+        return handles, slots
+
+    def _collect_segments(
+        self,
+        messages: List[Message],
+        slots: List[Optional[Tuple[Any, Optional[int]]]],
+        tmp_path: Path,
+        pause_ms: int,
+        on_progress: Optional[Callable[[int, int, str], None]],
+        start_silence: Callable[[Path], None],
+    ) -> Generator[Any, Any, List[Path]]:
+        """Save each message's audio as a segment file, in message order.
+
+        Shared by generate() and generate_async(), which differ only in how
+        they wait: this generator yields each message's pending request (a
+        Future or Task) and expects the request's result to be sent back. A
+        result of None means the worker already wrote the segment file.
+
+        Args:
+            messages: Messages being narrated
+            slots: Request per message, as returned by _start_requests()
+            tmp_path: Directory to write segments to
+            pause_ms: Milliseconds of pause between messages
+            on_progress: Optional callback(current, total, message_text)
+            start_silence: Called with the first segment's path, so the pause
+                           clip renders while the remaining requests run
+
+        Returns:
+            Segment paths in message order, as the generator's return value
+        """
+        total = len(messages)
+        segment_paths: List[Path] = []
+        for i, (message, slot) in enumerate(zip(messages, slots)):
+            if on_progress:
+                on_progress(i + 1, total, message.text[:50] if message.text else "")
+
+            if slot is None:
+                continue
+            handle, pos = slot
+            result = yield handle
+            segment_path = _segment_path(tmp_path, i)
+            if pos is not None:
+                segment_path.write_bytes(result[pos])
+            elif result is not None:
+                segment_path.write_bytes(result)
+            segment_paths.append(segment_path)
+
+            if len(segment_paths) == 1 and pause_ms > 0:
+                start_silence(segment_path)
+        return segment_paths
+
     def generate(
         self,
         db_path: Path,
@@ -159,55 +953,113 @@ class PodcastGenerator:
             pause_ms: Milliseconds of pause between messages
             on_progress: Optional callback(current, total, message_text)
         """
-        # Extract messages
-        messages = extract_messages(db_path, chat_id, start_date, end_date)
+        messages, jobs = self._prepare_jobs(db_path, chat_id, start_date, end_date)
 
-        # Filter out empty messages
-        messages = [m for m in messages if m.text and m.text.strip()]
+        # Silence gets its own worker: the TTS executor runs jobs in FIFO order, so
+        # silence queued there would only start once every TTS request had started
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                ThreadPoolExecutor(max_workers=self._tts_concurrency) as executor, \
+                ThreadPoolExecutor(max_workers=1) as silence_executor:
+            tmp_path = Path(tmp_dir)
 
-        if not messages:
-            raise ValueError("No messages to generate podcast from")
+            # Single requests write their own segment files, so cache hits never pass through memory
+            futures, slots = self._start_requests(
+                jobs,
+                lambda j, text, voice_id: executor.submit(
+                    self._synthesize_to, text, voice_id, _segment_path(tmp_path, j),
+                ),
+                lambda texts, voice_id: executor.submit(self._synthesize_batch, texts, voice_id),
+            )
+            silence_futures: List[Future] = []
+            steps = self._collect_segments(
+                messages, slots, tmp_path, pause_ms, on_progress,
+                lambda first: silence_futures.append(silence_executor.submit(
+                    _render_silence_like, first, tmp_path / "silence.mp3", pause_ms,
+                )),
+            )
 
-        # Merge consecutive same-sender messages
-        messages = merge_consecutive_messages(messages)
+            try:
+                future = next(steps)
+                while True:
+                    future = steps.send(future.result())
+            except StopIteration as done:
+                segment_paths = done.value
+            except BaseException:
+                # Don't keep paying for audio that will never be used
+                for pending in futures:
+                    pending.cancel()
+                raise
 
-        total = len(messages)
-        segment_paths: List[Path] = []
+            silence = silence_futures[0].result() if silence_futures else None
+            _stitch_segments(segment_paths, output_path, pause_ms, silence)
+
+    async def generate_async(
+        self,
+        db_path: Path,
+        chat_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        output_path: Path,
+        pause_ms: int = 500,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> None:
+        """Generate a podcast from chat messages on an asyncio event loop.
+
+        Behaves like generate(). TTS clients that define
+        generate_async(text, voice_id) are awaited directly with at most
+        tts_concurrency calls in flight; other clients run in worker threads.
+
+        Args:
+            db_path: Path to the iMessage database
+            chat_id: ID of the chat to extract messages from
+            start_date: Start of date range
+            end_date: End of date range
+            output_path: Path to write the output audio file
+            pause_ms: Milliseconds of pause between messages
+            on_progress: Optional callback(current, total, message_text)
+        """
+        messages, jobs = self._prepare_jobs(db_path, chat_id, start_date, end_date)
+        semaphore = asyncio.Semaphore(self._tts_concurrency)
+
+        async def synthesize(text: str, voice_id: str) -> bytes:
+            async with semaphore:
+                return await self._synthesize_async(text, voice_id)
+
+        async def synthesize_batch(texts: List[str], voice_id: str) -> List[bytes]:
+            async with semaphore:
+                return await asyncio.to_thread(self._synthesize_batch, texts, voice_id)
 
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
+            tasks, slots = self._start_requests(
+                jobs,
+                lambda j, text, voice_id: asyncio.create_task(synthesize(text, voice_id)),
+                lambda texts, voice_id: asyncio.create_task(synthesize_batch(texts, voice_id)),
+            )
+            silence_tasks: List[asyncio.Task] = []
+            steps = self._collect_segments(
+                messages, slots, tmp_path, pause_ms, on_progress,
+                lambda first: silence_tasks.append(asyncio.create_task(asyncio.to_thread(
+                    _render_silence_like, first, tmp_path / "silence.mp3", pause_ms,
+                ))),
+            )
 
-            for i, message in enumerate(messages):
-                # Report progress
-                if on_progress:
-                    on_progress(i + 1, total, message.text[:50] if message.text else "")
-
-                # Get voice for this sender
-                voice_id = self._get_voice_id(message.sender)
-                if not voice_id:
-                    import warnings
-                    warnings.warn(
-                        f"No voice mapped for sender '{message.sender}' and no _default - skipping"
-                    )
-                    continue
-
-                # Preprocess text for TTS
-                text = preprocess_text_for_tts(message.text)
-
-                # Generate audio
-                audio_bytes = self._tts.generate(text, voice_id=voice_id)
-
-                # Save to temp file
-                segment_path = tmp_path / f"segment_{i:05d}.mp3"
-                segment_path.write_bytes(audio_bytes)
-                segment_paths.append(segment_path)
-
-            # Stitch all segments together
-            if not segment_paths:
-                raise ValueError(
-                    "No audio segments generated - check voice mappings"
-                )
-            stitch_audio(segment_paths, output_path, pause_ms)
+            try:
+                try:
+                    task = next(steps)
+                    while True:
+                        task = steps.send(await task)
+                except StopIteration as done:
+                    segment_paths = done.value
+
+                silence = await silence_tasks[0] if silence_tasks else None
+                await asyncio.to_thread(_stitch_segments, segment_paths, output_path, pause_ms, silence)
+            finally:
+                # On failure, stop paying for audio that will never be used, then
+                # wait out every task so none is left running or unretrieved
+                for pending in (*tasks, *silence_tasks):
+                    pending.cancel()
+                await asyncio.gather(*tasks, *silence_tasks, return_exceptions=True)
 
     def estimate_cost(
         self,
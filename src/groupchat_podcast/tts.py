@@ -1,7 +1,9 @@
 """ElevenLabs TTS integration module."""
 
+import json
 import re
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional
 
 from elevenlabs import ElevenLabs
@@ -52,6 +54,44 @@ _EMOJI_PATTERN = re.compile(
 )
 
 
+# One pass over the emoji-free text for every word and punctuation rule;
+# alternatives are tried in order, so abbreviations win over the generic
+# all-caps rule.
+_PREPROCESS_PATTERN = re.compile(
+    rf"(?P<expand>(?i:\b(?:{'|'.join(_EXPAND_ABBREVIATIONS)})\b))"
+    # "bc" is expanded unless it follows a number or "century" (e.g. 300 BC)
+    r"|(?P<bc>(?i:(?<!\d\s)(?<!century\s)\bbc\b))"
+    rf"|(?P<upper>(?i:\b(?:{'|'.join(sorted(_UPPERCASE_ABBREVIATIONS))})\b))"
+    r"|(?P<bang>!{2,})"
+    r"|(?P<question>\?{2,})"
+    r"|(?P<caps>\b[A-Z]{4,}\b)"
+)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _preprocess_match(match: re.Match) -> str:
+    """Return the replacement for one _PREPROCESS_PATTERN match."""
+    kind = match.lastgroup
+    word = match.group(0)
+    if kind == "expand":
+        return _EXPAND_ABBREVIATIONS[word.lower()]
+    if kind == "bc":
+        return "because"
+    if kind == "upper":
+        return word.upper()
+    if kind == "bang":
+        return "!"
+    if kind == "question":
+        return "?"
+    # Lowercase excessive all-caps words, skip known abbreviations
+    if word.lower() in _KNOWN_ABBREVIATIONS:
+        return word
+    return word.lower()
+
+
+# Chats repeat the same short messages ("lol", "ok", "idk") constantly
+@lru_cache(maxsize=8192)
 def preprocess_text_for_tts(text: str) -> str:
     """Preprocess chat text for natural TTS output.
 
@@ -63,44 +103,19 @@ def preprocess_text_for_tts(text: str) -> str:
     5. Lowercase excessive all-caps words (4+ chars), preserving known abbreviations
     6. Collapse whitespace
     """
-    # 1. Strip emojis
+    # 1. Strip emojis first, so the word rules see the text around them joined up
     text = _EMOJI_PATTERN.sub("", text)
 
-    # 2. Expand abbreviations (case-insensitive, whole-word)
-    for abbrev, expansion in _EXPAND_ABBREVIATIONS.items():
-        text = re.sub(rf"\b{abbrev}\b", expansion, text, flags=re.IGNORECASE)
-
-    # Handle "bc" conditionally — don't expand after numbers or "century"
-    text = re.sub(
-        r"(?<!\d\s)(?<!century\s)\bbc\b",
-        "because",
-        text,
-        flags=re.IGNORECASE,
-    )
-
-    # 3. Uppercase abbreviations that TTS mispronounces phonetically
-    for abbrev in _UPPERCASE_ABBREVIATIONS:
-        text = re.sub(
-            rf"\b{abbrev}\b", abbrev.upper(), text, flags=re.IGNORECASE
-        )
-
-    # 4. Normalize repeated punctuation (preserve ellipsis)
-    text = re.sub(r"!{2,}", "!", text)
-    text = re.sub(r"\?{2,}", "?", text)
-
-    # 5. Lowercase excessive all-caps words (4+ chars), skip known abbreviations
-    def _lowercase_caps(match: re.Match) -> str:
-        word = match.group(0)
-        if word.lower() in _KNOWN_ABBREVIATIONS:
-            return word
-        return word.lower()
+    # 2-5 in a single scan
+    text = _PREPROCESS_PATTERN.sub(_preprocess_match, text)
 
-    text = re.sub(r"\b[A-Z]{4,}\b", _lowercase_caps, text)
+    # 6. Collapse whitespace (after emoji removal, which can leave double spaces)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
 
-    # 6. Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
 
-    return text
+# Model and output format used for every request
+_MODEL_ID = "eleven_multilingual_v2"
+_OUTPUT_FORMAT = "mp3_44100_128"
 
 
 @dataclass
@@ -123,9 +138,14 @@ class TTSClient:
             voice_settings: Optional voice settings dict with keys like
                 stability, similarity_boost, style, use_speaker_boost
         """
-        self._client = ElevenLabs(api_key=api_key)
+        self._api_key = api_key
         self._voice_settings = voice_settings
 
+    @cached_property
+    def _client(self):
+        """ElevenLabs SDK client, built on first API call."""
+        return ElevenLabs(api_key=self._api_key)
+
     def generate(self, text: str, voice_id: str) -> bytes:
         """Generate audio from text using the specified voice.
 
@@ -139,8 +159,8 @@ class TTSClient:
         kwargs: Dict[str, Any] = {
             "text": text,
             "voice_id": voice_id,
-            "model_id": "eleven_multilingual_v2",
-            "output_format": "mp3_44100_128",
+            "model_id": _MODEL_ID,
+            "output_format": _OUTPUT_FORMAT,
         }
         if self._voice_settings is not None:
             kwargs["voice_settings"] = self._voice_settings
@@ -152,6 +172,25 @@ class TTSClient:
             return audio
         return b"".join(audio)
 
+    def cache_key(self) -> str:
+        """Describe the settings, besides text and voice, that shape generated audio.
+
+        Audio cached under one key must not be served for another, so a
+        change of model, output format or voice settings misses the cache.
+
+        Returns:
+            A stable string built from the model, output format and voice settings
+        """
+        return json.dumps(
+            {
+                "model_id": _MODEL_ID,
+                "output_format": _OUTPUT_FORMAT,
+                "voice_settings": self._voice_settings,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
     def search_voices(self, query: str = "") -> List[Voice]:
         """Search for available voices.
 
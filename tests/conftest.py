@@ -1,12 +1,14 @@
 """Test fixtures for groupchat-podcast."""
 
+import os
 import sqlite3
-import tempfile
 from datetime import datetime
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from groupchat_podcast.tts import TTSClient
+
 
 # Mac epoch: January 1, 2001
 MAC_EPOCH = datetime(2001, 1, 1)
@@ -15,14 +17,20 @@ MAC_EPOCH = datetime(2001, 1, 1)
 def datetime_to_mac_timestamp(dt: datetime) -> int:
     """Convert Python datetime to Mac nanosecond timestamp."""
     delta = dt - MAC_EPOCH
-    return int(delta.total_seconds() * 1_000_000_000)
+    return delta.days * 86_400_000_000_000 + delta.seconds * 1_000_000_000 + delta.microseconds * 1000
 
 
-@pytest.fixture
-def mock_chat_db(tmp_path):
-    """Create a mock iMessage database with test data."""
-    db_path = tmp_path / "chat.db"
+@pytest.fixture(scope="session")
+def mock_chat_db(tmp_path_factory):
+    """Create a mock iMessage database with test data.
+
+    Built once per session; tests only read from it, so it must not be mutated.
+    """
+    db_path = tmp_path_factory.mktemp("chat_db") / "chat.db"
     conn = sqlite3.connect(db_path)
+    # Throwaway test DB: skip the rollback journal file and fsyncs
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
     cursor = conn.cursor()
 
     # Create tables matching iMessage schema
@@ -86,80 +94,184 @@ def mock_chat_db(tmp_path):
         );
     """)
 
-    # Insert test handles (participants)
-    cursor.executemany(
-        "INSERT INTO handle (id, service) VALUES (?, ?)",
-        [
-            ("+15551234567", "iMessage"),
-            ("+15559876543", "iMessage"),
-            ("friend@email.com", "iMessage"),
-        ],
-    )
-
-    # Insert test chat (group chat)
-    cursor.execute(
-        "INSERT INTO chat (guid, chat_identifier, display_name, room_name) VALUES (?, ?, ?, ?)",
-        ("chat123", "chat123456", "Test Group Chat", "room123"),
-    )
-
-    # Link handles to chat
-    cursor.executemany(
-        "INSERT INTO chat_handle_join (chat_id, handle_id) VALUES (?, ?)",
-        [(1, 1), (1, 2), (1, 3)],
-    )
-
-    # Insert test messages
-    messages = [
-        # Regular messages
-        ("msg1", "Hello everyone!", None, 1, datetime(2024, 1, 15, 10, 0, 0), 0, 0, 0, None, None),
-        ("msg2", "Hey! How's it going?", None, 2, datetime(2024, 1, 15, 10, 1, 0), 0, 0, 0, None, None),
-        ("msg3", "Check out this link https://example.com/cool-thing", None, 3, datetime(2024, 1, 15, 10, 2, 0), 0, 0, 0, None, None),
-        ("msg4", "lol", None, 1, datetime(2024, 1, 15, 10, 3, 0), 0, 0, 0, None, None),
-        ("msg5", None, None, 2, datetime(2024, 1, 15, 10, 4, 0), 0, 1, 0, None, None),  # Attachment only
-        ("msg6", "I sent this!", None, None, datetime(2024, 1, 15, 10, 5, 0), 1, 0, 0, None, None),  # is_from_me
-        # Reaction (should be filtered out)
-        ("msg7", 'Loved "Hello everyone!"', None, 2, datetime(2024, 1, 15, 10, 6, 0), 0, 0, 2000, "msg1", None),
-        # Thread reply
-        ("msg8", "This is a reply to the first message", None, 3, datetime(2024, 1, 16, 12, 0, 0), 0, 0, 0, None, "msg1"),
-        # Message outside date range
-        ("msg9", "This is from February", None, 1, datetime(2024, 2, 15, 10, 0, 0), 0, 0, 0, None, None),
-        # URL-only message
-        ("msg10", "https://github.com/some/repo", None, 2, datetime(2024, 1, 15, 10, 7, 0), 0, 0, 0, None, None),
-    ]
-
-    for msg in messages:
-        guid, text, attr_body, handle_id, dt, is_from_me, has_attach, assoc_type, assoc_guid, thread_guid = msg
-        mac_ts = datetime_to_mac_timestamp(dt)
+    # All inserts commit as one transaction
+    with conn:
+        # Insert test handles (participants)
+        cursor.executemany(
+            "INSERT INTO handle (id, service) VALUES (?, ?)",
+            [
+                ("+15551234567", "iMessage"),
+                ("+15559876543", "iMessage"),
+                ("friend@email.com", "iMessage"),
+            ],
+        )
+
+        # Insert test chat (group chat)
         cursor.execute(
+            "INSERT INTO chat (guid, chat_identifier, display_name, room_name) VALUES (?, ?, ?, ?)",
+            ("chat123", "chat123456", "Test Group Chat", "room123"),
+        )
+
+        # Link handles to chat
+        cursor.executemany(
+            "INSERT INTO chat_handle_join (chat_id, handle_id) VALUES (?, ?)",
+            [(1, 1), (1, 2), (1, 3)],
+        )
+
+        # Insert test messages
+        messages = [
+            # Regular messages
+            ("msg1", "Hello everyone!", None, 1, datetime(2024, 1, 15, 10, 0, 0), 0, 0, 0, None, None),
+            ("msg2", "Hey! How's it going?", None, 2, datetime(2024, 1, 15, 10, 1, 0), 0, 0, 0, None, None),
+            ("msg3", "Check out this link https://example.com/cool-thing", None, 3, datetime(2024, 1, 15, 10, 2, 0), 0, 0, 0, None, None),
+            ("msg4", "lol", None, 1, datetime(2024, 1, 15, 10, 3, 0), 0, 0, 0, None, None),
+            ("msg5", None, None, 2, datetime(2024, 1, 15, 10, 4, 0), 0, 1, 0, None, None),  # Attachment only
+            ("msg6", "I sent this!", None, None, datetime(2024, 1, 15, 10, 5, 0), 1, 0, 0, None, None),  # is_from_me
+            # Reaction (should be filtered out)
+            ("msg7", 'Loved "Hello everyone!"', None, 2, datetime(2024, 1, 15, 10, 6, 0), 0, 0, 2000, "msg1", None),
+            # Thread reply
+            ("msg8", "This is a reply to the first message", None, 3, datetime(2024, 1, 16, 12, 0, 0), 0, 0, 0, None, "msg1"),
+            # Message outside date range
+            ("msg9", "This is from February", None, 1, datetime(2024, 2, 15, 10, 0, 0), 0, 0, 0, None, None),
+            # URL-only message
+            ("msg10", "https://github.com/some/repo", None, 2, datetime(2024, 1, 15, 10, 7, 0), 0, 0, 0, None, None),
+        ]
+
+        # Swap each datetime for its Mac timestamp and insert them all in one call
+        cursor.executemany(
             """INSERT INTO message
                (guid, text, attributedBody, handle_id, date, is_from_me,
                 cache_has_attachments, associated_message_type, associated_message_guid, thread_originator_guid)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (guid, text, attr_body, handle_id, mac_ts, is_from_me, has_attach, assoc_type, assoc_guid, thread_guid),
+            [msg[:4] + (datetime_to_mac_timestamp(msg[4]),) + msg[5:] for msg in messages],
         )
 
-    # Link messages to chat
-    cursor.executemany(
-        "INSERT INTO chat_message_join (chat_id, message_id) VALUES (?, ?)",
-        [(1, i) for i in range(1, 11)],
-    )
-
-    # Add attachment for msg5
-    cursor.execute(
-        "INSERT INTO attachment (guid, filename, mime_type, transfer_name) VALUES (?, ?, ?, ?)",
-        ("attach1", "photo.jpg", "image/jpeg", "photo.jpg"),
-    )
-    cursor.execute(
-        "INSERT INTO message_attachment_join (message_id, attachment_id) VALUES (?, ?)",
-        (5, 1),
-    )
-
-    conn.commit()
+        # Link messages to chat
+        cursor.executemany(
+            "INSERT INTO chat_message_join (chat_id, message_id) VALUES (?, ?)",
+            [(1, i) for i in range(1, 11)],
+        )
+
+        # Add attachment for msg5
+        cursor.execute(
+            "INSERT INTO attachment (guid, filename, mime_type, transfer_name) VALUES (?, ?, ?, ?)",
+            ("attach1", "photo.jpg", "image/jpeg", "photo.jpg"),
+        )
+        cursor.execute(
+            "INSERT INTO message_attachment_join (message_id, attachment_id) VALUES (?, ?)",
+            (5, 1),
+        )
+
+    # Index like the real chat.db, after the bulk insert so each index is built once
+    cursor.executescript("""
+        CREATE INDEX message_idx_date ON message(date);
+        CREATE INDEX chat_message_join_idx_chat ON chat_message_join(chat_id, message_id);
+        CREATE INDEX chat_handle_join_idx_chat ON chat_handle_join(chat_id, handle_id);
+        CREATE INDEX message_attachment_join_idx_message ON message_attachment_join(message_id);
+    """)
+
     conn.close()
 
     return db_path
 
 
+@pytest.fixture(scope="session")
+def fake_db(tmp_path_factory):
+    """Write a placeholder chat.db once per session for checks that only open it.
+
+    Shared by every test that requests it, so it must not be modified.
+    """
+    db_path = tmp_path_factory.mktemp("fake_db") / "chat.db"
+    db_path.write_bytes(b"fake-db-content")
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def scratch_dir(tmp_path_factory):
+    """Return one empty dir per session for tests that only build paths inside it.
+
+    Shared by every test that requests it, so nothing may be written there.
+    """
+    return tmp_path_factory.mktemp("scratch")
+
+
+@pytest.fixture
+def fake_homebrew_ffmpeg(monkeypatch):
+    """Make ffmpeg resolvable only at /opt/homebrew/bin, as on a Mac where PATH lacks it."""
+    monkeypatch.setattr("shutil.which", lambda cmd, *args, **kwargs: None)
+    monkeypatch.setattr("os.path.isfile", lambda p: p == "/opt/homebrew/bin/ffmpeg")
+    monkeypatch.setattr("os.access", lambda *args, **kwargs: True)
+
+
+@pytest.fixture
+def empty_env(monkeypatch):
+    """Clear the environment and stop preflight from reloading it from a .env file."""
+    for key in list(os.environ):
+        monkeypatch.delenv(key)
+    monkeypatch.setattr("groupchat_podcast.preflight.load_dotenv", lambda *args, **kwargs: None)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_tts_cache(tmp_path_factory):
+    """Point the default TTS cache at a scratch dir so tests never write to ~/.cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "groupchat_podcast.podcast.DEFAULT_TTS_CACHE_DIR",
+            tmp_path_factory.mktemp("tts_cache"),
+        )
+        yield
+
+
+class _StubElevenLabs:
+    """Plain stand-in for the ElevenLabs SDK client that records what it is asked.
+
+    Configure a test by setting audio, error, voices_found or voice on the
+    instance; calls land in convert_calls, search_calls and get_calls.
+    """
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.audio = b"audio"
+        self.error = None
+        self.voices_found = []
+        self.voice = None
+        self.convert_calls = []
+        self.search_calls = []
+        self.get_calls = []
+        self.text_to_speech = SimpleNamespace(convert=self._convert)
+        self.voices = SimpleNamespace(search=self._search, get=self._get)
+
+    def _convert(self, **kwargs):
+        self.convert_calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return self.audio
+
+    def _search(self, search=None):
+        self.search_calls.append(search)
+        return SimpleNamespace(voices=self.voices_found)
+
+    def _get(self, voice_id):
+        self.get_calls.append(voice_id)
+        return self.voice
+
+
+@pytest.fixture
+def stub_elevenlabs(monkeypatch):
+    """Swap the ElevenLabs SDK client class for _StubElevenLabs."""
+    monkeypatch.setattr("groupchat_podcast.tts.ElevenLabs", _StubElevenLabs)
+
+
+@pytest.fixture
+def tts_client(stub_elevenlabs):
+    """Return a TTSClient backed by a stub ElevenLabs SDK, plus that stub.
+
+    Built per test, so recorded calls never carry over between tests.
+    """
+    client = TTSClient(api_key="test-key")
+    return client, client._client
+
+
 @pytest.fixture
 def sample_audio_bytes():
     """Return valid MP3 bytes for testing using pydub."""
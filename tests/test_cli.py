@@ -1,13 +1,13 @@
 """Tests for CLI argument parsing and behavior."""
 
-import sys
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from groupchat_podcast import __version__
 from groupchat_podcast.cli import (
+    _load_env_once,
     build_parser,
     get_api_key,
     get_date_range,
@@ -19,29 +19,44 @@ from groupchat_podcast.cli import (
 from groupchat_podcast.imessage import GroupChat
 
 
+@pytest.fixture
+def base_argv(mock_chat_db, tmp_path):
+    """argv for a fully flag-driven run over January 2024 in mock_chat_db."""
+    return [
+        "groupchat-podcast",
+        "--db-path", str(mock_chat_db),
+        "--chat-id", "1",
+        "--start-date", "2024-01-01",
+        "--end-date", "2024-01-31",
+        "-o", str(tmp_path / "out.mp3"),
+    ]
+
+
+@pytest.fixture
+def tts_mock(mocker):
+    """Stand-in for TTSClient whose API key check finds no voices."""
+    mock_tts = mocker.Mock()
+    mock_tts.search_voices.return_value = []
+    return mock_tts
+
+
 class TestPreflightIntegration:
     """Tests for preflight checks integrated into main()."""
 
-    def test_main_calls_preflight_before_prompts(self, mock_chat_db, mocker, tmp_path):
+    def test_main_calls_preflight_before_prompts(self, base_argv, mocker, tts_mock):
         """main() runs preflight checks before any interactive prompts."""
         call_order = []
-        mocker.patch("sys.argv", [
-            "groupchat-podcast",
-            "--db-path", str(mock_chat_db),
-            "--chat-id", "1",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31",
-            "-o", str(tmp_path / "out.mp3"),
-        ])
-        mocker.patch("groupchat_podcast.cli.run_preflight",
-                     side_effect=lambda *a, **kw: (call_order.append("preflight"), True)[1])
-        mocker.patch("groupchat_podcast.cli.get_api_key",
-                     side_effect=lambda: (call_order.append("get_api_key"), "test-key")[1])
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "v1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=False)
+        mocker.patch("sys.argv", base_argv)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            run_preflight=mocker.Mock(
+                side_effect=lambda *a, **kw: (call_order.append("preflight"), True)[1]),
+            get_api_key=mocker.Mock(
+                side_effect=lambda: (call_order.append("get_api_key"), "test-key")[1]),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            assign_voices=mocker.Mock(return_value={"_default": "v1"}),
+            show_cost_estimate=mocker.Mock(return_value=False),
+        )
 
         with pytest.raises(SystemExit):
             main()
@@ -63,30 +78,23 @@ class TestPreflightIntegration:
         assert exc_info.value.code == 1
         mock_get_api_key.assert_not_called()
 
-    def test_skip_checks_bypasses_preflight(self, mock_chat_db, mocker, tmp_path):
+    def test_skip_checks_bypasses_preflight(self, base_argv, mocker, tts_mock):
         """--skip-checks flag causes main() to skip preflight entirely."""
-        mocker.patch("sys.argv", [
-            "groupchat-podcast",
-            "--skip-checks",
-            "--db-path", str(mock_chat_db),
-            "--chat-id", "1",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31",
-            "-o", str(tmp_path / "out.mp3"),
-        ])
-        mock_preflight = mocker.patch("groupchat_podcast.cli.run_preflight")
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "v1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=False)
+        mocker.patch("sys.argv", base_argv + ["--skip-checks"])
+        patches = mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            run_preflight=mocker.DEFAULT,
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            assign_voices=mocker.Mock(return_value={"_default": "v1"}),
+            show_cost_estimate=mocker.Mock(return_value=False),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
 
         assert exc_info.value.code == 0
-        mock_preflight.assert_not_called()
+        patches["run_preflight"].assert_not_called()
 
 
 class TestBuildParser:
@@ -155,25 +163,38 @@ class TestBuildParser:
             parser.parse_args(["--version"])
         assert exc_info.value.code == 0
 
+    def test_main_version_skips_parser(self, mocker, capsys):
+        """main() answers --version directly, without building the full parser."""
+        mocker.patch("sys.argv", ["groupchat-podcast", "--version"])
+        mock_build_parser = mocker.patch("groupchat_podcast.cli.build_parser")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.strip() == f"groupchat-podcast {__version__}"
+        mock_build_parser.assert_not_called()
+
 
 class TestMainDbPath:
     """Tests for --db-path flag behavior in main()."""
 
-    def test_uses_custom_db_path_to_find_chats(self, mock_chat_db, mocker, tmp_path):
+    def test_uses_custom_db_path_to_find_chats(self, mock_chat_db, mocker, tmp_path, tts_mock):
         """main() reads from the custom --db-path database, not the default."""
         mocker.patch("sys.argv", [
             "groupchat-podcast", "--db-path", str(mock_chat_db),
             "-o", str(tmp_path / "out.mp3"),
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.select_group_chat", return_value=1)
-        mocker.patch("groupchat_podcast.cli.get_date_range",
-                     return_value=(datetime(2024, 1, 1), datetime(2024, 1, 31)))
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "v1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=False)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            select_group_chat=mocker.Mock(return_value=1),
+            get_date_range=mocker.Mock(
+                return_value=(datetime(2024, 1, 1), datetime(2024, 1, 31))),
+            assign_voices=mocker.Mock(return_value={"_default": "v1"}),
+            show_cost_estimate=mocker.Mock(return_value=False),
+        )
 
         # The fact that main() doesn't crash with "database not found" proves
         # it used our mock_chat_db (which exists) instead of DEFAULT_DB_PATH
@@ -183,13 +204,14 @@ class TestMainDbPath:
         # Exit 0 = cancelled at cost estimate, not exit 1 = db not found
         assert exc_info.value.code == 0
 
-    def test_exits_with_error_for_nonexistent_custom_db_path(self, mocker):
+    def test_exits_with_error_for_nonexistent_custom_db_path(self, mocker, tts_mock):
         """main() exits with code 1 when --db-path points to nonexistent file."""
         mocker.patch("sys.argv", ["groupchat-podcast", "--db-path", "/nonexistent/chat.db"])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -200,22 +222,16 @@ class TestMainDbPath:
 class TestMainChatId:
     """Tests for --chat-id flag behavior in main()."""
 
-    def test_proceeds_without_prompting_when_chat_id_provided(self, mock_chat_db, mocker, tmp_path):
+    def test_proceeds_without_prompting_when_chat_id_provided(self, base_argv, mocker, tts_mock):
         """When --chat-id is given, main() proceeds to date range without prompting for chat selection."""
-        mocker.patch("sys.argv", [
-            "groupchat-podcast",
-            "--db-path", str(mock_chat_db),
-            "--chat-id", "1",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31",
-            "-o", str(tmp_path / "out.mp3"),
-        ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "v1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=False)
+        mocker.patch("sys.argv", base_argv)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            assign_voices=mocker.Mock(return_value={"_default": "v1"}),
+            show_cost_estimate=mocker.Mock(return_value=False),
+        )
 
         # If this reaches cost estimate and exits 0 (cancelled), it means
         # it successfully used chat_id=1 and dates without any interactive prompts
@@ -227,7 +243,7 @@ class TestMainChatId:
 class TestMainDateFlags:
     """Tests for --start-date and --end-date flag behavior."""
 
-    def test_uses_provided_dates_for_message_extraction(self, mock_chat_db, mocker, tmp_path):
+    def test_uses_provided_dates_for_message_extraction(self, mock_chat_db, mocker, tmp_path, tts_mock):
         """When --start-date and --end-date are given, messages are extracted from that range."""
         mocker.patch("sys.argv", [
             "groupchat-podcast",
@@ -237,24 +253,24 @@ class TestMainDateFlags:
             "--end-date", "2024-02-28",
             "-o", str(tmp_path / "out.mp3"),
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-
         # With Feb dates, the mock DB has only 1 message ("This is from February")
         # whereas Jan has many. If the dates are being used, we should see the Feb message
         # extracted. We can verify by checking it doesn't exit with "no messages" for Feb,
         # since there IS a Feb message in mock_chat_db
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "v1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=False)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            assign_voices=mocker.Mock(return_value={"_default": "v1"}),
+            show_cost_estimate=mocker.Mock(return_value=False),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
         # Exit 0 = reached cost estimate and cancelled, meaning messages were found
         assert exc_info.value.code == 0
 
-    def test_exits_with_error_when_only_start_date_provided(self, mock_chat_db, mocker):
+    def test_exits_with_error_when_only_start_date_provided(self, mock_chat_db, mocker, tts_mock):
         """main() exits with error when --start-date is given without --end-date."""
         mocker.patch("sys.argv", [
             "groupchat-podcast",
@@ -262,16 +278,17 @@ class TestMainDateFlags:
             "--chat-id", "1",
             "--start-date", "2024-01-01",
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
         assert exc_info.value.code == 1
 
-    def test_exits_with_error_for_invalid_date_format(self, mock_chat_db, mocker):
+    def test_exits_with_error_for_invalid_date_format(self, mock_chat_db, mocker, tts_mock):
         """main() exits with error for malformed date strings."""
         mocker.patch("sys.argv", [
             "groupchat-podcast",
@@ -280,10 +297,11 @@ class TestMainDateFlags:
             "--start-date", "not-a-date",
             "--end-date", "2024-01-31",
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -293,7 +311,7 @@ class TestMainDateFlags:
 class TestMainOutputFlag:
     """Tests for --output flag behavior."""
 
-    def test_writes_output_to_specified_path(self, mock_chat_db, mocker, tmp_path, sample_audio_bytes):
+    def test_writes_output_to_specified_path(self, mock_chat_db, mocker, tmp_path, sample_audio_bytes, tts_mock):
         """main() writes the podcast to the --output path."""
         output_file = tmp_path / "custom_output.mp3"
         mocker.patch("sys.argv", [
@@ -304,13 +322,14 @@ class TestMainOutputFlag:
             "--end-date", "2024-01-31",
             "-o", str(output_file),
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mock_tts.generate.return_value = sample_audio_bytes
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.assign_voices", return_value={"_default": "voice-1"})
-        mocker.patch("groupchat_podcast.cli.show_cost_estimate", return_value=True)
+        tts_mock.generate.return_value = sample_audio_bytes
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            assign_voices=mocker.Mock(return_value={"_default": "voice-1"}),
+            show_cost_estimate=mocker.Mock(return_value=True),
+        )
 
         main()
 
@@ -393,6 +412,17 @@ class TestGetApiKey:
         with pytest.raises(KeyboardInterrupt):
             get_api_key()
 
+    def test_loads_dotenv_only_once(self, mocker):
+        """Repeated get_api_key calls parse the .env file a single time."""
+        _load_env_once.cache_clear()
+        mock_load_dotenv = mocker.patch("groupchat_podcast.cli.load_dotenv")
+        mocker.patch.dict("os.environ", {"ELEVENLABS_API_KEY": "sk-test-key-123"})
+
+        get_api_key()
+        get_api_key()
+
+        mock_load_dotenv.assert_called_once()
+
 
 class TestGetDateRange:
     """Tests for interactive date range selection via beaupy."""
@@ -444,22 +474,15 @@ class TestGetOutputPath:
 class TestFriendlyErrors:
     """Tests for user-friendly error handling in main()."""
 
-    def test_permission_error_shows_friendly_message(self, mock_chat_db, mocker, capsys):
+    def test_permission_error_shows_friendly_message(self, base_argv, mocker, capsys, tts_mock):
         """PermissionError during message extraction shows friendly panel, not traceback."""
-        mocker.patch("sys.argv", [
-            "groupchat-podcast",
-            "--db-path", str(mock_chat_db),
-            "--chat-id", "1",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31",
-            "-o", "/tmp/out.mp3",
-        ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.extract_messages",
-                     side_effect=PermissionError("Operation not permitted"))
+        mocker.patch("sys.argv", base_argv)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            extract_messages=mocker.Mock(side_effect=PermissionError("Operation not permitted")),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -468,22 +491,15 @@ class TestFriendlyErrors:
         captured = capsys.readouterr()
         assert "Traceback" not in captured.err
 
-    def test_generic_exception_shows_friendly_message(self, mock_chat_db, mocker, capsys):
+    def test_generic_exception_shows_friendly_message(self, base_argv, mocker, capsys, tts_mock):
         """Unhandled exceptions show a friendly error, not a raw traceback."""
-        mocker.patch("sys.argv", [
-            "groupchat-podcast",
-            "--db-path", str(mock_chat_db),
-            "--chat-id", "1",
-            "--start-date", "2024-01-01",
-            "--end-date", "2024-01-31",
-            "-o", "/tmp/out.mp3",
-        ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
-        mocker.patch("groupchat_podcast.cli.extract_messages",
-                     side_effect=RuntimeError("Something broke"))
+        mocker.patch("sys.argv", base_argv)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+            extract_messages=mocker.Mock(side_effect=RuntimeError("Something broke")),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
@@ -496,7 +512,7 @@ class TestFriendlyErrors:
 class TestNoMessagesUX:
     """Tests for improved UX when no messages are found."""
 
-    def test_no_messages_suggests_wider_date_range(self, mock_chat_db, mocker, capsys):
+    def test_no_messages_suggests_wider_date_range(self, mock_chat_db, mocker, capsys, tts_mock):
         """When no messages found, output suggests trying a different date range."""
         mocker.patch("sys.argv", [
             "groupchat-podcast",
@@ -506,10 +522,11 @@ class TestNoMessagesUX:
             "--end-date", "2025-01-31",
             "-o", "/tmp/out.mp3",
         ])
-        mocker.patch("groupchat_podcast.cli.get_api_key", return_value="test-key")
-        mock_tts = mocker.Mock()
-        mock_tts.search_voices.return_value = []
-        mocker.patch("groupchat_podcast.cli.TTSClient", return_value=mock_tts)
+        mocker.patch.multiple(
+            "groupchat_podcast.cli",
+            get_api_key=mocker.Mock(return_value="test-key"),
+            TTSClient=mocker.Mock(return_value=tts_mock),
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             main()
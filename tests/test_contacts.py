@@ -12,6 +12,20 @@ from groupchat_podcast.contacts import (
     resolve_participants,
 )
 
+# A path that never exists, so tests about missing directories need no tmp dir
+_MISSING = Path("/__groupchat_podcast_missing__")
+
+
+def _insert_rows(cursor, table_columns: str, rows):
+    """Insert all rows with a single multi-row VALUES statement."""
+    if not rows:
+        return
+    placeholders = "(" + ", ".join("?" * len(rows[0])) + ")"
+    cursor.execute(
+        f"INSERT INTO {table_columns} VALUES " + ", ".join([placeholders] * len(rows)),
+        [value for row in rows for value in row],
+    )
+
 
 def _create_mock_addressbook(db_path: Path, contacts):
     """Create a mock AddressBook database with the given contacts.
@@ -20,6 +34,16 @@ def _create_mock_addressbook(db_path: Path, contacts):
         first_name, last_name, organization, phones (list), emails (list)
     """
     conn = sqlite3.connect(db_path)
+    # Throwaway test DB: skip the rollback journal file and fsyncs
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    _populate_addressbook(conn, contacts)
+    conn.close()
+
+
+def _populate_addressbook(conn: sqlite3.Connection, contacts):
+    """Create the AddressBook tables on an open connection and insert contacts."""
     cursor = conn.cursor()
     cursor.executescript("""
         CREATE TABLE ZABCDRECORD (
@@ -43,55 +67,82 @@ def _create_mock_addressbook(db_path: Path, contacts):
         );
     """)
 
-    for contact in contacts:
-        cursor.execute(
-            "INSERT INTO ZABCDRECORD (ZFIRSTNAME, ZLASTNAME, ZORGANIZATION) VALUES (?, ?, ?)",
-            (contact.get("first_name"), contact.get("last_name"), contact.get("organization")),
+    # Number records 1..N up front so phone/email rows can reference them
+    # without reading lastrowid back after every insert
+    record_rows = []
+    phone_rows = []
+    email_rows = []
+    for record_pk, contact in enumerate(contacts, start=1):
+        record_rows.append(
+            (record_pk, contact.get("first_name"), contact.get("last_name"), contact.get("organization"))
         )
-        record_pk = cursor.lastrowid
-
-        for phone in contact.get("phones", []):
-            cursor.execute(
-                "INSERT INTO ZABCDPHONENUMBER (ZOWNER, ZFULLNUMBER) VALUES (?, ?)",
-                (record_pk, phone),
-            )
-
-        for email in contact.get("emails", []):
-            cursor.execute(
-                "INSERT INTO ZABCDEMAILADDRESS (ZOWNER, ZADDRESS, ZADDRESSNORMALIZED) VALUES (?, ?, ?)",
-                (record_pk, email, email.lower()),
-            )
-
-    conn.commit()
+        phone_rows.extend((record_pk, phone) for phone in contact.get("phones", []))
+        email_rows.extend((record_pk, email, email.lower()) for email in contact.get("emails", []))
+
+    with conn:
+        _insert_rows(cursor, "ZABCDRECORD (Z_PK, ZFIRSTNAME, ZLASTNAME, ZORGANIZATION)", record_rows)
+        _insert_rows(cursor, "ZABCDPHONENUMBER (ZOWNER, ZFULLNUMBER)", phone_rows)
+        _insert_rows(cursor, "ZABCDEMAILADDRESS (ZOWNER, ZADDRESS, ZADDRESSNORMALIZED)", email_rows)
+
+
+def _single_contact_db(tmp_path: Path, contact) -> Path:
+    """Create an AddressBook DB holding just one contact and return its path."""
+    db_path = tmp_path / "AddressBook-v22.abcddb"
+    _create_mock_addressbook(db_path, [contact])
+    return db_path
+
+
+def _backup_to(template: sqlite3.Connection, db_path: Path) -> None:
+    """Copy a template database into a new file with SQLite's backup API."""
+    dest = sqlite3.connect(db_path)
+    template.backup(dest)
+    dest.close()
+
+
+_STANDARD_CONTACTS = [
+    {
+        "first_name": "Alice",
+        "last_name": "Johnson",
+        "phones": ["+1 (555) 123-4567"],
+        "emails": ["alice@example.com"],
+    },
+    {
+        "first_name": "Bob",
+        "last_name": "Smith",
+        "phones": ["+15559876543"],
+        "emails": ["Bob.Smith@Work.com"],
+    },
+]
+
+
+@pytest.fixture(scope="session")
+def _contacts_template():
+    """In-memory AddressBook holding the standard two contacts, built once per session."""
+    conn = sqlite3.connect(":memory:")
+    _populate_addressbook(conn, _STANDARD_CONTACTS)
+    yield conn
     conn.close()
 
 
 @pytest.fixture
-def contacts_dir(tmp_path):
+def contacts_dir(tmp_path, _contacts_template):
     """Create a mock AddressBook Sources directory with one source DB."""
     sources_dir = tmp_path / "Sources"
     source_dir = sources_dir / "ABC-123-DEF"
     source_dir.mkdir(parents=True)
-    db_path = source_dir / "AddressBook-v22.abcddb"
-
-    _create_mock_addressbook(db_path, [
-        {
-            "first_name": "Alice",
-            "last_name": "Johnson",
-            "phones": ["+1 (555) 123-4567"],
-            "emails": ["alice@example.com"],
-        },
-        {
-            "first_name": "Bob",
-            "last_name": "Smith",
-            "phones": ["+15559876543"],
-            "emails": ["Bob.Smith@Work.com"],
-        },
-    ])
+    _backup_to(_contacts_template, source_dir / "AddressBook-v22.abcddb")
 
     return sources_dir
 
 
+@pytest.fixture(scope="module")
+def standard_lookup(tmp_path_factory, _contacts_template):
+    """Contact lookup for the standard two contacts, built once per module."""
+    db_path = tmp_path_factory.mktemp("contacts") / "AddressBook-v22.abcddb"
+    _backup_to(_contacts_template, db_path)
+    return build_contact_lookup([db_path])
+
+
 class TestFindContactDbs:
     """Tests for discovering AddressBook source databases."""
 
@@ -101,10 +152,9 @@ class TestFindContactDbs:
         assert len(dbs) == 1
         assert dbs[0].name == "AddressBook-v22.abcddb"
 
-    def test_returns_empty_list_when_directory_missing(self, tmp_path):
+    def test_returns_empty_list_when_directory_missing(self):
         """Returns empty list when Sources directory doesn't exist."""
-        dbs = find_contact_dbs(tmp_path / "nonexistent")
-        assert dbs == []
+        assert find_contact_dbs(_MISSING) == []
 
     def test_finds_multiple_source_databases(self, tmp_path):
         """Finds databases from multiple account sources (iCloud, Google, etc.)."""
@@ -124,39 +174,33 @@ class TestFindContactDbs:
 class TestNormalizePhone:
     """Tests for phone number normalization."""
 
-    def test_strips_formatting_characters(self):
-        """Removes parentheses, spaces, dashes from phone numbers."""
-        assert normalize_phone("+1 (555) 123-4567") == "15551234567"
-
-    def test_strips_imessage_handle_suffix(self):
-        """Removes (smsft), (smsft_or), (smsfp) suffixes from iMessage handles."""
-        assert normalize_phone("+12014623963(smsft)") == "12014623963"
-        assert normalize_phone("+12014623963(smsft_or)") == "12014623963"
-
-    def test_handles_plain_e164_number(self):
-        """E.164 format numbers pass through with just the + stripped."""
-        assert normalize_phone("+15551234567") == "15551234567"
-
-    def test_handles_international_numbers(self):
-        """International numbers preserve all digits."""
-        assert normalize_phone("+49 177 1789322") == "491771789322"
+    @pytest.mark.parametrize("raw, expected", [
+        # Removes parentheses, spaces, dashes
+        ("+1 (555) 123-4567", "15551234567"),
+        # Removes (smsft), (smsft_or) suffixes from iMessage handles
+        ("+12014623963(smsft)", "12014623963"),
+        ("+12014623963(smsft_or)", "12014623963"),
+        # E.164 passes through with just the + stripped
+        ("+15551234567", "15551234567"),
+        # International numbers preserve all digits
+        ("+49 177 1789322", "491771789322"),
+    ])
+    def test_normalizes_to_digits(self, raw, expected):
+        """Phone numbers and iMessage handles normalize to bare digits."""
+        assert normalize_phone(raw) == expected
 
 
 class TestBuildContactLookup:
     """Tests for building the phone/email to name lookup."""
 
-    def test_resolves_phone_number_to_contact_name(self, contacts_dir):
+    def test_resolves_phone_number_to_contact_name(self, standard_lookup):
         """Phone numbers in the DB map to 'FirstName LastName'."""
-        dbs = find_contact_dbs(contacts_dir)
-        lookup = build_contact_lookup(dbs)
         # Contacts DB has "+1 (555) 123-4567" which normalizes to "15551234567"
-        assert lookup["15551234567"] == "Alice Johnson"
+        assert standard_lookup["15551234567"] == "Alice Johnson"
 
-    def test_resolves_email_to_contact_name(self, contacts_dir):
+    def test_resolves_email_to_contact_name(self, standard_lookup):
         """Email addresses map to contact names (case-insensitive)."""
-        dbs = find_contact_dbs(contacts_dir)
-        lookup = build_contact_lookup(dbs)
-        assert lookup["bob.smith@work.com"] == "Bob Smith"
+        assert standard_lookup["bob.smith@work.com"] == "Bob Smith"
 
     def test_merges_contacts_from_multiple_sources(self, tmp_path):
         """Contacts from multiple source databases are all included."""
@@ -174,33 +218,23 @@ class TestBuildContactLookup:
             {"first_name": "Dee", "last_name": "Reynolds", "emails": ["dee@paddy.com"]},
         ])
 
-        dbs = find_contact_dbs(sources_dir)
-        lookup = build_contact_lookup(dbs)
+        lookup = build_contact_lookup([
+            source1 / "AddressBook-v22.abcddb",
+            source2 / "AddressBook-v22.abcddb",
+        ])
         assert lookup["15550001111"] == "Charlie Day"
         assert lookup["dee@paddy.com"] == "Dee Reynolds"
 
     def test_handles_contact_with_only_first_name(self, tmp_path):
         """Contacts with no last name display just the first name."""
-        sources_dir = tmp_path / "Sources" / "src"
-        sources_dir.mkdir(parents=True)
-        _create_mock_addressbook(sources_dir / "AddressBook-v22.abcddb", [
-            {"first_name": "Madonna", "phones": ["+15550009999"]},
-        ])
-
-        dbs = find_contact_dbs(sources_dir.parent)
-        lookup = build_contact_lookup(dbs)
+        db_path = _single_contact_db(tmp_path, {"first_name": "Madonna", "phones": ["+15550009999"]})
+        lookup = build_contact_lookup([db_path])
         assert lookup["15550009999"] == "Madonna"
 
     def test_handles_contact_with_only_organization(self, tmp_path):
         """Contacts with no name fall back to organization."""
-        sources_dir = tmp_path / "Sources" / "src"
-        sources_dir.mkdir(parents=True)
-        _create_mock_addressbook(sources_dir / "AddressBook-v22.abcddb", [
-            {"organization": "PagerDuty", "phones": ["+18001234567"]},
-        ])
-
-        dbs = find_contact_dbs(sources_dir.parent)
-        lookup = build_contact_lookup(dbs)
+        db_path = _single_contact_db(tmp_path, {"organization": "PagerDuty", "phones": ["+18001234567"]})
+        lookup = build_contact_lookup([db_path])
         assert lookup["18001234567"] == "PagerDuty"
 
     def test_returns_empty_lookup_for_empty_db_list(self):
@@ -215,44 +249,44 @@ class TestBuildContactLookup:
         assert lookup == {}
 
 
+# Shared lookup for TestResolveParticipants, keyed the way build_contact_lookup keys it
+_RESOLVE_LOOKUP = {
+    "15551234567": "Alice Johnson",
+    "alice@example.com": "Alice Johnson",
+    "12014623963": "Frank Reynolds",
+    # "Me" must never be looked up, even if a contact matches it
+    "me": "Some Contact Named Me",
+}
+
+
 class TestResolveParticipants:
     """Tests for resolving raw iMessage handles to display names."""
 
-    def test_resolves_phone_handle_to_contact_name(self):
-        """Phone number handle resolves to the matching contact name."""
-        lookup = {"15551234567": "Alice Johnson"}
-        result = resolve_participants(["+15551234567"], lookup)
-        assert result["+15551234567"] == "Alice Johnson"
-
-    def test_resolves_email_handle_to_contact_name(self):
-        """Email handle resolves to the matching contact name."""
-        lookup = {"alice@example.com": "Alice Johnson"}
-        result = resolve_participants(["alice@example.com"], lookup)
-        assert result["alice@example.com"] == "Alice Johnson"
-
-    def test_falls_back_to_raw_handle_when_no_match(self):
-        """Unrecognized handles return the raw identifier."""
-        lookup = {}
-        result = resolve_participants(["+15550000000"], lookup)
-        assert result["+15550000000"] == "+15550000000"
-
-    def test_me_passes_through_unchanged(self):
-        """'Me' is never looked up and always returns 'Me'."""
-        lookup = {"me": "Some Contact Named Me"}
-        result = resolve_participants(["Me"], lookup)
-        assert result["Me"] == "Me"
-
-    def test_strips_imessage_suffix_before_lookup(self):
-        """Handles with (smsft) suffixes are normalized before lookup."""
-        lookup = {"12014623963": "Frank Reynolds"}
-        result = resolve_participants(["+12014623963(smsft)"], lookup)
-        assert result["+12014623963(smsft)"] == "Frank Reynolds"
-
-    def test_email_lookup_is_case_insensitive(self):
-        """Email matching ignores case."""
-        lookup = {"alice@example.com": "Alice Johnson"}
-        result = resolve_participants(["Alice@Example.COM"], lookup)
-        assert result["Alice@Example.COM"] == "Alice Johnson"
+    def test_resolves_all_handle_kinds_in_one_call(self):
+        """Each kind of handle resolves correctly within a single batch."""
+        expected = {
+            # Phone number handle resolves to the matching contact name
+            "+15551234567": "Alice Johnson",
+            # Email handle resolves to the matching contact name
+            "alice@example.com": "Alice Johnson",
+            # Unrecognized handles return the raw identifier
+            "+15550000000": "+15550000000",
+            # 'Me' passes through unchanged
+            "Me": "Me",
+            # (smsft) suffixes are normalized before lookup
+            "+12014623963(smsft)": "Frank Reynolds",
+            # Email matching ignores case
+            "Alice@Example.COM": "Alice Johnson",
+        }
+
+        result = resolve_participants(list(expected), _RESOLVE_LOOKUP)
+
+        assert result == expected
+
+    def test_falls_back_to_raw_handle_with_empty_lookup(self):
+        """With no contacts at all, every handle maps to itself."""
+        result = resolve_participants(["+15550000000", "bob@example.com"], {})
+        assert result == {"+15550000000": "+15550000000", "bob@example.com": "bob@example.com"}
 
 
 class TestCLIDisplaysContactNames:
@@ -1,10 +1,16 @@
 """Tests for iMessage database extraction."""
 
+import contextlib
+import dataclasses
+import functools
 import sqlite3
+import tempfile
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
+from groupchat_podcast import imessage
 from groupchat_podcast.imessage import (
     GroupChat,
     Message,
@@ -19,6 +25,45 @@ from groupchat_podcast.imessage import (
 MAC_EPOCH_UTC = datetime(2001, 1, 1, tzinfo=timezone.utc)
 
 
+@functools.lru_cache(maxsize=None)
+def _utc_to_local(dt_utc: datetime) -> datetime:
+    """Convert an aware UTC datetime to naive local time, memoized per instant.
+
+    Deliberately not a fixed LOCAL_TZ offset: the local offset depends on the
+    date (DST), and convert_mac_timestamp honours that.
+    """
+    return dt_utc.astimezone().replace(tzinfo=None)
+
+
+def _build_empty_db_bytes() -> bytes:
+    """Build a chat.db with the group-chat tables but no rows, as raw file bytes."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE handle (ROWID INTEGER PRIMARY KEY, id TEXT, service TEXT);
+        CREATE TABLE chat (ROWID INTEGER PRIMARY KEY, guid TEXT, chat_identifier TEXT, display_name TEXT, room_name TEXT);
+        CREATE TABLE chat_handle_join (chat_id INTEGER, handle_id INTEGER);
+        CREATE INDEX chat_handle_join_idx_chat ON chat_handle_join(chat_id, handle_id);
+    """)
+    try:
+        if hasattr(conn, "serialize"):  # Python 3.11+
+            return conn.serialize()
+        # Older Pythons: copy the pages to a scratch file and read it back
+        with tempfile.TemporaryDirectory() as tmp:
+            disk_path = Path(tmp) / "empty.db"
+            disk_conn = sqlite3.connect(disk_path)
+            conn.backup(disk_conn)
+            disk_conn.close()
+            return disk_path.read_bytes()
+    finally:
+        conn.close()
+
+
+_EMPTY_DB_BYTES = _build_empty_db_bytes()
+
+# attributedBody blob for "Hello", spelled out byte for byte
+HELLO_BLOB = b"streamtyped\x00NSString\x01\x94\x84\x01\x2b\x05Hello\x86"
+
+
 class TestMacTimestampConversion:
     """Tests for Mac timestamp conversion."""
 
@@ -26,7 +71,7 @@ class TestMacTimestampConversion:
         """Convert a known UTC Mac timestamp to local datetime."""
         # Mac timestamp for 2024-01-15 15:00:00 UTC
         target_utc = datetime(2024, 1, 15, 15, 0, 0, tzinfo=timezone.utc)
-        expected_local = target_utc.astimezone().replace(tzinfo=None)
+        expected_local = _utc_to_local(target_utc)
         mac_ts = _utc_to_mac_nanos(target_utc)
 
         result = convert_mac_timestamp(mac_ts)
@@ -39,11 +84,20 @@ class TestMacTimestampConversion:
 
     def test_handles_zero_timestamp(self):
         """Zero timestamp should return Mac epoch (2001-01-01) in local time."""
-        expected = datetime(2001, 1, 1, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        expected = _utc_to_local(MAC_EPOCH_UTC)
         result = convert_mac_timestamp(0)
 
         assert result == expected
 
+    def test_round_trips_microseconds_exactly(self):
+        """Local datetime -> Mac timestamp -> local datetime loses no precision."""
+        original = datetime(2024, 3, 5, 7, 8, 9, 123457)
+
+        mac_ts = datetime_to_mac_timestamp(original)
+
+        assert isinstance(mac_ts, int)
+        assert convert_mac_timestamp(mac_ts) == original
+
 
 def _make_typedstream_blob(text_bytes: bytes) -> bytes:
     """Build a synthetic typedstream blob matching iMessage's attributedBody format.
@@ -51,94 +105,60 @@ def _make_typedstream_blob(text_bytes: bytes) -> bytes:
     Format: streamtyped preamble + NSString + \x01\x94\x84\x01\x2b + length + text + \x86
     Length encoding: 0-127 = single byte, 128+ = \x81 + 2-byte LE uint16.
     """
-    preamble = b"streamtyped\x00"
-    ns_string = b"NSString"
-    marker = b"\x01\x94\x84\x01\x2b"  # ends with + (0x2b)
+    buf = bytearray(b"streamtyped\x00")  # preamble
+    buf += b"NSString"
+    buf += b"\x01\x94\x84\x01\x2b"  # marker, ends with + (0x2b)
     length = len(text_bytes)
     if length < 128:
-        length_field = bytes([length])
+        buf.append(length)
     else:
-        length_field = b"\x81" + length.to_bytes(2, "little")
-    return preamble + ns_string + marker + length_field + text_bytes + b"\x86"
+        buf.append(0x81)
+        buf += length.to_bytes(2, "little")
+    buf += text_bytes
+    buf.append(0x86)
+    return bytes(buf)
+
+
+# Length-boundary parse cases, built once at import: name -> (blob, expected text)
+_PARSE_CASES = {
+    name: (_make_typedstream_blob(text.encode("utf-8")), text)
+    for name, text in [
+        # 127 chars is the max single-byte length — boundary value
+        ("127-chars", "A" * 127),
+        # 128 chars requires multi-byte (0x81) length encoding
+        ("128-chars", "B" * 128),
+        # Typical medium message with 0x81 encoding
+        ("200-chars", "C" * 200),
+        # Longer message, still 0x81 encoding (max 65535)
+        ("500-chars", "D" * 500),
+        # Multi-byte UTF-8: 50 emoji (each 4 bytes) = 200 bytes, but only 50 characters
+        ("multibyte-utf8", "\U0001f600" * 50),
+    ]
+}
 
 
 class TestParseAttributedBody:
     """Tests for parsing attributedBody blob."""
 
-    def test_returns_empty_for_none(self):
-        """None input returns empty string."""
-        result = parse_attributed_body(None)
-        assert result == ""
-
-    def test_returns_empty_for_empty_bytes(self):
-        """Empty bytes returns empty string."""
-        result = parse_attributed_body(b"")
-        assert result == ""
+    @pytest.mark.parametrize("blob", [None, b""])
+    def test_returns_empty_for_missing_body(self, blob):
+        """None or empty bytes input returns empty string."""
+        assert parse_attributed_body(blob) == ""
 
     def test_extracts_text_from_attributed_body(self):
         """Extract text from attributedBody blob format."""
-        text = b"Hello"
-        blob = _make_typedstream_blob(text)
-
-        result = parse_attributed_body(blob)
-
-        assert result == "Hello"
-
-    def test_parses_exactly_127_chars(self):
-        """127 chars is the max single-byte length — boundary value."""
-        text = "A" * 127
-        blob = _make_typedstream_blob(text.encode("utf-8"))
-
-        result = parse_attributed_body(blob)
-
-        assert result == text
-        assert len(result) == 127
-
-    def test_parses_128_chars(self):
-        """128 chars requires multi-byte (0x81) length encoding."""
-        text = "B" * 128
-        blob = _make_typedstream_blob(text.encode("utf-8"))
-
-        result = parse_attributed_body(blob)
-
-        assert result == text
-        assert len(result) == 128
-
-    def test_parses_200_chars(self):
-        """Typical medium message with 0x81 encoding."""
-        text = "C" * 200
-        blob = _make_typedstream_blob(text.encode("utf-8"))
-
-        result = parse_attributed_body(blob)
-
-        assert result == text
-        assert len(result) == 200
-
-    def test_parses_500_chars(self):
-        """Longer message, still 0x81 encoding (max 65535)."""
-        text = "D" * 500
-        blob = _make_typedstream_blob(text.encode("utf-8"))
-
-        result = parse_attributed_body(blob)
-
-        assert result == text
-        assert len(result) == 500
+        assert parse_attributed_body(HELLO_BLOB) == "Hello"
 
-    def test_parses_multibyte_utf8_over_127_chars(self):
-        """Multi-byte UTF-8: byte length > 127 even if char count is smaller.
+    @pytest.mark.parametrize("blob, text", _PARSE_CASES.values(), ids=_PARSE_CASES.keys())
+    def test_parses_length_boundaries(self, blob, text):
+        """Length field round-trips across the single/multi-byte encoding boundary.
 
         The typedstream length field is the byte length, not the character count.
         """
-        # 50 emoji (each 4 bytes) = 200 bytes, but only 50 characters
-        text = "\U0001f600" * 50
-        text_bytes = text.encode("utf-8")
-        assert len(text_bytes) == 200  # sanity: byte length > 127
-        blob = _make_typedstream_blob(text_bytes)
-
         result = parse_attributed_body(blob)
 
         assert result == text
-        assert len(result) == 50
+        assert len(result) == len(text)
 
 
 class TestListGroupChats:
@@ -158,192 +178,169 @@ class TestListGroupChats:
     def test_returns_empty_for_no_group_chats(self, tmp_path):
         """Return empty list when no group chats exist."""
         db_path = tmp_path / "empty.db"
-        import sqlite3
-
-        conn = sqlite3.connect(db_path)
-        conn.executescript("""
-            CREATE TABLE handle (ROWID INTEGER PRIMARY KEY, id TEXT, service TEXT);
-            CREATE TABLE chat (ROWID INTEGER PRIMARY KEY, guid TEXT, chat_identifier TEXT, display_name TEXT, room_name TEXT);
-            CREATE TABLE chat_handle_join (chat_id INTEGER, handle_id INTEGER);
-        """)
-        conn.close()
+        db_path.write_bytes(_EMPTY_DB_BYTES)
 
         chats = list_group_chats(db_path)
 
         assert chats == []
 
 
-class TestExtractMessages:
-    """Tests for extracting messages from a group chat."""
+def _no_title(url):
+    """Simulate a page-title fetch that fails."""
+    return None
 
-    def test_extracts_messages_in_date_range(self, mock_chat_db):
-        """Extract messages within the specified date range."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
 
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
+# What the module-wide _fetch_url_title stub answers with; swap via _fetching_titles
+_title_fetcher = [_no_title]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_fetch_url_title(module_mocker):
+    """Keep this module off the network by routing title fetches through _title_fetcher."""
+    module_mocker.patch.object(imessage, "_fetch_url_title", new=lambda url: _title_fetcher[0](url))
+
+
+@contextlib.contextmanager
+def _fetching_titles(fetcher):
+    """Answer page-title fetches with fetcher inside the block."""
+    _title_fetcher[0] = fetcher
+    try:
+        yield
+    finally:
+        _title_fetcher[0] = _no_title
+
+
+def _index(messages):
+    """Map each message's text to its (position, message) in one pass."""
+    return {m.text: (i, m) for i, m in enumerate(messages)}
+
+
+# Fake page titles for the two links in mock_chat_db
+_PAGE_TITLES = {
+    "https://example.com/cool-thing": "Cool Thing - Example Site",
+    "https://github.com/some/repo": "some/repo: A cool project",
+}
+
+# The January 2024 window that holds every interesting mock_chat_db message
+_JANUARY = {"chat_id": 1, "start_date": datetime(2024, 1, 1), "end_date": datetime(2024, 1, 31)}
 
+
+@pytest.fixture(scope="module")
+def january_messages(mock_chat_db, _stub_fetch_url_title):
+    """January messages with every page-title fetch failing, extracted once per module."""
+    return extract_messages(mock_chat_db, **_JANUARY)
+
+
+@pytest.fixture(scope="module")
+def january_messages_with_titles(mock_chat_db, _stub_fetch_url_title):
+    """January messages with page titles from _PAGE_TITLES, extracted once per module."""
+    with _fetching_titles(_PAGE_TITLES.get):
+        return extract_messages(mock_chat_db, **_JANUARY)
+
+
+class TestExtractMessages:
+    """Tests for extracting messages from a group chat.
+
+    The shared message lists come from module-scoped fixtures; tests must not mutate them.
+    """
+
+    def test_extracts_messages_in_date_range(self, january_messages):
+        """Extract messages within the specified date range."""
         # Should include January messages but not February
         # Should exclude reactions (associated_message_type != 0)
-        assert len(messages) >= 5  # msg1-6, msg8, minus reaction
-        assert all(isinstance(m, Message) for m in messages)
+        assert len(january_messages) >= 5  # msg1-6, msg8, minus reaction
+        assert all(isinstance(m, Message) for m in january_messages)
 
-    def test_filters_out_reactions(self, mock_chat_db):
+    def test_filters_out_reactions(self, january_messages):
         """Reactions (tapbacks) should not be included."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # No message should have associated_message_type != 0
-        texts = [m.text for m in messages]
+        texts = [m.text for m in january_messages]
         assert not any("Loved" in (t or "") for t in texts)
 
-    def test_attributes_sender_correctly(self, mock_chat_db):
+    def test_attributes_sender_correctly(self, january_messages):
         """Messages should have correct sender attribution."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
+        by_text = _index(january_messages)
 
-        # Find the "Hello everyone!" message
-        hello_msg = next((m for m in messages if m.text == "Hello everyone!"), None)
-        assert hello_msg is not None
-        assert hello_msg.sender == "+15551234567"
+        # The "Hello everyone!" message
+        assert "Hello everyone!" in by_text
+        assert by_text["Hello everyone!"][1].sender == "+15551234567"
 
-        # Find the is_from_me message
-        my_msg = next((m for m in messages if m.text == "I sent this!"), None)
-        assert my_msg is not None
-        assert my_msg.sender == "Me"
+        # The is_from_me message
+        assert "I sent this!" in by_text
+        assert by_text["I sent this!"][1].sender == "Me"
 
-    def test_replaces_attachment_only_with_placeholder(self, mock_chat_db):
+    def test_replaces_attachment_only_with_placeholder(self, january_messages):
         """Messages with only attachments get placeholder text."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # Find the attachment-only message (msg5)
         # It should have placeholder text like "Look at this photo"
         attachment_msg = next(
-            (m for m in messages if "photo" in (m.text or "").lower() or "image" in (m.text or "").lower()),
+            (m for m in january_messages if "photo" in (m.text or "").lower() or "image" in (m.text or "").lower()),
             None,
         )
         assert attachment_msg is not None
 
-    def test_replaces_url_with_page_title_in_speech(self, mock_chat_db, mocker):
+    def test_replaces_url_with_page_title_in_speech(self, january_messages_with_titles):
         """URLs in messages are replaced with the page title for natural speech."""
-        mocker.patch(
-            "groupchat_podcast.imessage._fetch_url_title",
-
-
-            return_value="Cool Thing - Example Site",
-        )
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # msg3: "Check out this link https://example.com/cool-thing"
         # Should become: "Check out this link: Cool Thing - Example Site"
-        url_msg = next((m for m in messages if "Cool Thing" in (m.text or "")), None)
+        url_msg = next((m for m in january_messages_with_titles if "Cool Thing" in (m.text or "")), None)
         assert url_msg is not None
         assert "https://" not in url_msg.text
         assert "Cool Thing - Example Site" in url_msg.text
 
-    def test_url_only_message_gets_title(self, mock_chat_db, mocker):
+    def test_url_only_message_gets_title(self, january_messages_with_titles):
         """A message that is just a URL becomes 'Check out this link: {title}'."""
-        def mock_fetch(url):
-            if "github.com" in url:
-                return "some/repo: A cool project"
-            return "Other Page"
-
-        mocker.patch(
-            "groupchat_podcast.imessage._fetch_url_title",
-
-
-            side_effect=mock_fetch,
-        )
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # msg10: "https://github.com/some/repo" - URL-only message
-        url_msg = next((m for m in messages if "cool project" in (m.text or "").lower()), None)
+        url_msg = next(
+            (m for m in january_messages_with_titles if "cool project" in (m.text or "").lower()),
+            None,
+        )
         assert url_msg is not None
         assert "https://" not in url_msg.text
         assert "Check out this link:" in url_msg.text
 
-    def test_falls_back_to_domain_when_title_fetch_fails(self, mock_chat_db, mocker):
+    def test_falls_back_to_domain_when_title_fetch_fails(self, january_messages):
         """When page title can't be fetched, falls back to the domain name."""
-        mocker.patch(
-            "groupchat_podcast.imessage._fetch_url_title",
-
-
-            return_value=None,
-        )
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # msg10: "https://github.com/some/repo" - should fall back to domain
-        url_msg = next((m for m in messages if "github.com" in (m.text or "")), None)
+        url_msg = next((m for m in january_messages if "github.com" in (m.text or "")), None)
         assert url_msg is not None
         assert "https://" not in url_msg.text
         assert "this link: github.com" in url_msg.text
 
-    def test_orders_threads_after_parent(self, mock_chat_db):
+    def test_orders_threads_after_parent(self, january_messages):
         """Thread replies should appear immediately after their parent message."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
+        by_text = _index(january_messages)
 
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
-        # Find the parent message (msg1: "Hello everyone!")
-        parent_idx = next(
-            (i for i, m in enumerate(messages) if m.text == "Hello everyone!"),
-            None,
-        )
-        assert parent_idx is not None
-
-        # Find the reply (msg8: "This is a reply to the first message")
-        reply_idx = next(
-            (i for i, m in enumerate(messages) if "reply" in (m.text or "").lower()),
-            None,
-        )
-        assert reply_idx is not None
+        # The parent message (msg1) and its reply (msg8)
+        assert "Hello everyone!" in by_text
+        assert "This is a reply to the first message" in by_text
+        parent_idx = by_text["Hello everyone!"][0]
+        reply_idx = by_text["This is a reply to the first message"][0]
 
         # Reply should come immediately after parent, not at its chronological position
         assert reply_idx == parent_idx + 1
 
-    def test_excludes_messages_outside_date_range(self, mock_chat_db):
+    def test_excludes_messages_outside_date_range(self, january_messages):
         """Messages outside the date range should not be included."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
         # February message should not be included
-        texts = [m.text for m in messages]
+        texts = [m.text for m in january_messages]
         assert not any("February" in (t or "") for t in texts)
 
-    def test_keeps_short_messages(self, mock_chat_db):
+    def test_keeps_short_messages(self, january_messages):
         """Short messages like 'lol' should be kept."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2024, 1, 31)
-
-        messages = extract_messages(mock_chat_db, chat_id=1, start_date=start, end_date=end)
-
-        texts = [m.text for m in messages]
+        texts = [m.text for m in january_messages]
         assert "lol" in texts
 
+    def test_messages_are_immutable(self, january_messages):
+        """Extracted messages can't be modified in place, so shared lists stay intact."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            january_messages[0].text = "changed"
+
 
 def _utc_to_mac_nanos(dt_utc: datetime) -> int:
     """Convert a UTC datetime to Mac nanosecond timestamp (ground truth)."""
     delta = dt_utc - MAC_EPOCH_UTC
-    return int(delta.total_seconds() * 1_000_000_000)
+    return delta.days * 86_400_000_000_000 + delta.seconds * 1_000_000_000 + delta.microseconds * 1000
 
 
 def _make_utc_chat_db(tmp_path, messages_utc):
@@ -351,8 +348,8 @@ def _make_utc_chat_db(tmp_path, messages_utc):
 
     messages_utc: list of (guid, text, utc_datetime) tuples
     """
-    db_path = tmp_path / "tz_chat.db"
-    conn = sqlite3.connect(db_path)
+    # Build everything in memory, then copy the finished pages to disk once
+    conn = sqlite3.connect(":memory:")
     cur = conn.cursor()
     cur.executescript("""
         CREATE TABLE handle (ROWID INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT, service TEXT);
@@ -368,20 +365,32 @@ def _make_utc_chat_db(tmp_path, messages_utc):
             filename TEXT, mime_type TEXT, transfer_name TEXT);
         CREATE TABLE message_attachment_join (message_id INTEGER, attachment_id INTEGER);
     """)
-    cur.execute("INSERT INTO handle (id, service) VALUES (?, ?)", ("+15550001111", "iMessage"))
-    cur.execute("INSERT INTO chat (guid, chat_identifier, display_name) VALUES (?, ?, ?)",
-                ("tz_chat", "tz_chat", "TZ Test Chat"))
-    cur.execute("INSERT INTO chat_handle_join (chat_id, handle_id) VALUES (1, 1)")
-
-    for i, (guid, text, utc_dt) in enumerate(messages_utc, start=1):
-        mac_ts = _utc_to_mac_nanos(utc_dt)
-        cur.execute(
+    cur.executescript("""
+        INSERT INTO handle (id, service) VALUES ('+15550001111', 'iMessage');
+        INSERT INTO chat (guid, chat_identifier, display_name) VALUES ('tz_chat', 'tz_chat', 'TZ Test Chat');
+        INSERT INTO chat_handle_join (chat_id, handle_id) VALUES (1, 1);
+    """)
+    with conn:
+        cur.executemany(
             "INSERT INTO message (guid, text, handle_id, date, associated_message_type) VALUES (?, ?, 1, ?, 0)",
-            (guid, text, mac_ts),
+            [(guid, text, _utc_to_mac_nanos(utc_dt)) for guid, text, utc_dt in messages_utc],
+        )
+        cur.executemany(
+            "INSERT INTO chat_message_join (chat_id, message_id) VALUES (1, ?)",
+            [(i,) for i in range(1, len(messages_utc) + 1)],
         )
-        cur.execute("INSERT INTO chat_message_join (chat_id, message_id) VALUES (1, ?)", (i,))
 
-    conn.commit()
+    # Index like the real chat.db, after the bulk insert so each index is built once
+    cur.executescript("""
+        CREATE INDEX message_idx_date ON message(date);
+        CREATE INDEX chat_message_join_idx_chat ON chat_message_join(chat_id, message_id);
+        CREATE INDEX chat_handle_join_idx_chat ON chat_handle_join(chat_id, handle_id);
+    """)
+
+    db_path = tmp_path / "tz_chat.db"
+    disk_conn = sqlite3.connect(db_path)
+    conn.backup(disk_conn)
+    disk_conn.close()
     conn.close()
     return db_path
 
@@ -404,7 +413,7 @@ class TestTimezoneHandling:
 
         # Query using the LOCAL time equivalent
         # msg_utc in local time:
-        msg_local = msg_utc.astimezone().replace(tzinfo=None)
+        msg_local = _utc_to_local(msg_utc)
         start_local = msg_local - timedelta(hours=1)
         end_local = msg_local + timedelta(hours=1)
 
@@ -416,7 +425,7 @@ class TestTimezoneHandling:
     def test_message_timestamp_is_local_time(self, tmp_path):
         """convert_mac_timestamp should return local time, not UTC."""
         msg_utc = datetime(2024, 7, 4, 20, 0, 0, tzinfo=timezone.utc)
-        expected_local = msg_utc.astimezone().replace(tzinfo=None)
+        expected_local = _utc_to_local(msg_utc)
 
         mac_ts = _utc_to_mac_nanos(msg_utc)
         result = convert_mac_timestamp(mac_ts)
@@ -451,7 +460,7 @@ class TestTimezoneHandling:
         """
         # Message at 2024-01-16 05:00 UTC (= midnight local in UTC-5)
         msg_utc = datetime(2024, 1, 16, 5, 0, 0, tzinfo=timezone.utc)
-        msg_local = msg_utc.astimezone().replace(tzinfo=None)
+        msg_local = _utc_to_local(msg_utc)
 
         db_path = _make_utc_chat_db(tmp_path, [
             ("msg_midnight", "midnight message", msg_utc),
@@ -1,6 +1,11 @@
 """Tests for podcast generation and audio stitching."""
 
+import asyncio
+import os
 import shutil
+import subprocess
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -9,9 +14,11 @@ import pytest
 from groupchat_podcast.imessage import Message
 from groupchat_podcast.podcast import (
     PodcastGenerator,
+    TTSCache,
     merge_consecutive_messages,
     stitch_audio,
 )
+from groupchat_podcast.tts import TTSClient
 
 # Check if ffmpeg is available
 FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
@@ -22,6 +29,19 @@ requires_ffmpeg = pytest.mark.skipif(
 )
 
 
+def _reported_and_decoded_seconds(path: Path):
+    """Return the duration ffprobe reports for a file and the length of its decoded audio."""
+    reported = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    pcm = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-f", "s16le", "-ac", "1", "-ar", "8000", "-"],
+        capture_output=True, check=True,
+    ).stdout
+    return float(reported), len(pcm) / 2 / 8000
+
+
 @requires_ffmpeg
 class TestStitchAudio:
     """Tests for audio stitching functionality."""
@@ -83,6 +103,105 @@ class TestStitchAudio:
         content = output_path.read_bytes()
         assert content[:2] == b"\xff\xfb" or content[:3] == b"ID3"
 
+    def test_joins_matching_mp3s_without_ffmpeg_concat(self, mocker, tmp_path, sample_audio_bytes):
+        """Same-format MP3s and their pauses are joined in memory without spawning ffmpeg."""
+        segments = []
+        for i in range(6):
+            seg = tmp_path / f"seg{i}.mp3"
+            seg.write_bytes(sample_audio_bytes)
+            segments.append(seg)
+        run_spy = mocker.spy(subprocess, "run")
+
+        output_path = tmp_path / "output.mp3"
+        stitch_audio(segments, output_path, pause_ms=300)
+
+        assert run_spy.call_count == 0
+        decode = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(output_path), "-f", "null", "-"],
+            capture_output=True, text=True,
+        )
+        assert decode.returncode == 0 and decode.stderr == ""
+        reported, decoded = _reported_and_decoded_seconds(output_path)
+        assert reported == pytest.approx(decoded, abs=0.03)
+
+    def test_pauses_keep_a_cbr_join_at_constant_bitrate(self, tmp_path):
+        """Silence between CBR segments uses their bitrate, so the joined file stays CBR."""
+        segments = []
+        for i in range(2):
+            seg = tmp_path / f"seg{i}.mp3"
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", f"sine=f={440 + 110 * i}:d=1",
+                 "-ar", "44100", "-ac", "2", "-c:a", "libmp3lame", "-b:a", "128k", str(seg)],
+                check=True,
+            )
+            segments.append(seg)
+
+        output_path = tmp_path / "output.mp3"
+        stitch_audio(segments, output_path, pause_ms=500)
+
+        # The header frame says Info for CBR streams and Xing for VBR ones
+        head = output_path.read_bytes()[:512]
+        assert b"Info" in head and b"Xing" not in head
+        reported, decoded = _reported_and_decoded_seconds(output_path)
+        assert reported == pytest.approx(decoded, abs=0.03)
+
+    def test_joined_duration_is_right_with_mixed_bitrates(self, tmp_path):
+        """Joining CBR and VBR segments keeps the reported duration equal to the decoded audio."""
+        segments = []
+        for i, rate_args in enumerate((["-b:a", "128k"], ["-q:a", "2"], ["-b:a", "64k"])):
+            seg = tmp_path / f"seg{i}.mp3"
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", f"sine=f={440 + 110 * i}:d=1.{i + 2}",
+                 "-ar", "44100", "-ac", "1", "-c:a", "libmp3lame", *rate_args, str(seg)],
+                check=True,
+            )
+            segments.append(seg)
+
+        output_path = tmp_path / "output.mp3"
+        stitch_audio(segments, output_path, pause_ms=500)
+
+        reported, decoded = _reported_and_decoded_seconds(output_path)
+        assert decoded == pytest.approx(1.2 + 1.3 + 1.4 + 2 * 0.5, abs=0.2)
+        assert reported == pytest.approx(decoded, abs=0.03)
+
+    def test_pads_mismatched_segments_in_one_concat_pass(self, mocker, tmp_path):
+        """Mixed formats are re-encoded in a single ffmpeg concat; MP3 silence needs no probe or render."""
+        segments = []
+        for i, (rate, layout, seconds) in enumerate(
+            [(11025, "mono", 1.0), (44100, "stereo", 1.5), (22050, "mono", 0.7), (11025, "mono", 1.0)]
+        ):
+            seg = tmp_path / f"seg{i}.mp3"
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", f"sine=f=440:r={rate}:d={seconds}",
+                 "-ac", "1" if layout == "mono" else "2", "-c:a", "libmp3lame", str(seg)],
+                check=True,
+            )
+            segments.append(seg)
+        run_spy = mocker.spy(subprocess, "run")
+
+        output_path = tmp_path / "output.mp3"
+        stitch_audio(segments, output_path, pause_ms=300)
+
+        tools = [Path(call.args[0][0]).name for call in run_spy.call_args_list]
+        assert tools == ["ffmpeg"]
+        reported, decoded = _reported_and_decoded_seconds(output_path)
+        assert decoded == pytest.approx(1.0 + 1.5 + 0.7 + 1.0 + 3 * 0.3, abs=0.1)
+        assert reported == pytest.approx(decoded, abs=0.1)
+
+    def test_handles_paths_with_quotes(self, tmp_path, sample_audio_bytes):
+        """Segment paths with quotes are escaped correctly in the concat list."""
+        seg_dir = tmp_path / "it's here"
+        seg_dir.mkdir()
+        seg1 = seg_dir / "seg1.mp3"
+        seg2 = seg_dir / "seg2.mp3"
+        seg1.write_bytes(sample_audio_bytes)
+        seg2.write_bytes(sample_audio_bytes)
+
+        output_path = tmp_path / "output.mp3"
+        stitch_audio([seg1, seg2], output_path, pause_ms=200)
+
+        assert output_path.stat().st_size > 0
+
 
 class TestStitchAudioNoFfmpeg:
     """Tests that don't require ffmpeg."""
@@ -94,6 +213,19 @@ class TestStitchAudioNoFfmpeg:
         with pytest.raises(ValueError):
             stitch_audio([], output_path, pause_ms=500)
 
+    def test_missing_ffmpeg_raises_runtime_error(self, monkeypatch, tmp_path):
+        """Segments that need ffmpeg fail clearly when it isn't installed."""
+        monkeypatch.setattr("groupchat_podcast.podcast._FFMPEG_PATH", None)
+        monkeypatch.setattr("groupchat_podcast.podcast._FFPROBE_PATH", None)
+        segments = []
+        for i in range(2):
+            seg = tmp_path / f"seg{i}.wav"
+            seg.write_bytes(b"RIFF not an mp3")
+            segments.append(seg)
+
+        with pytest.raises(RuntimeError, match="not found"):
+            stitch_audio(segments, tmp_path / "output.mp3", pause_ms=500)
+
 
 @requires_ffmpeg
 class TestPodcastGeneratorWithFfmpeg:
@@ -149,7 +281,7 @@ class TestPodcastGeneratorWithFfmpeg:
         )
 
         calls = mock_tts.generate.call_args_list
-        voice_ids_used = [call.kwargs.get("voice_id") or call.args[1] for call in calls]
+        voice_ids_used = [call.args[1] for call in calls]
 
         assert "alice-voice" in voice_ids_used
         assert "bob-voice" in voice_ids_used or "my-voice" in voice_ids_used
@@ -174,7 +306,7 @@ class TestPodcastGeneratorWithFfmpeg:
         )
 
         calls = mock_tts.generate.call_args_list
-        voice_ids_used = [call.kwargs.get("voice_id") or call.args[1] for call in calls]
+        voice_ids_used = [call.args[1] for call in calls]
 
         assert "fallback-voice" in voice_ids_used
 
@@ -287,6 +419,16 @@ class TestMergeConsecutiveMessages:
         result = merge_consecutive_messages(messages)
         assert result[0].text == "Am I too critical? Truly love it"
 
+    def test_smart_separator_uses_space_after_colon_and_trailing_space(self):
+        """Colons/semicolons and punctuation followed by whitespace also take a space."""
+        messages = [
+            Message(sender="Alice", text="Shopping list:", timestamp=datetime(2024, 1, 15, 10, 0, 0), guid="1"),
+            Message(sender="Alice", text="Done! ", timestamp=datetime(2024, 1, 15, 10, 0, 10), guid="2"),
+            Message(sender="Alice", text="Eggs", timestamp=datetime(2024, 1, 15, 10, 0, 20), guid="3"),
+        ]
+        result = merge_consecutive_messages(messages)
+        assert result[0].text == "Shopping list: Done! Eggs"
+
     def test_preserves_sender_and_timestamp_from_first_message(self):
         """Merged message should use first message's sender and timestamp."""
         first_ts = datetime(2024, 1, 15, 10, 0, 0)
@@ -421,6 +563,266 @@ class TestPodcastGeneratorPreprocessing:
 class TestPodcastGeneratorNoFfmpeg:
     """Tests for podcast generation that don't require ffmpeg."""
 
+    def test_concurrent_tts_keeps_message_order(self, mocker, tmp_path):
+        """Segments and progress follow message order even when TTS calls finish out of order."""
+        # Earlier messages take longer, so calls complete in reverse order
+        delays = {"First": 0.06, "Second": 0.03, "Third": 0.0}
+
+        def slow_generate(text, voice_id):
+            time.sleep(delays[text])
+            return text.encode()
+
+        mock_tts = mocker.Mock()
+        mock_tts.generate.side_effect = slow_generate
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender=sender, text=text, timestamp=datetime(2024, 1, 15, 10, minute, 0), guid=text)
+                for minute, (sender, text) in enumerate([("Alice", "First"), ("Bob", "Second"), ("Alice", "Third")])
+            ],
+        )
+        stitched = []
+        mocker.patch(
+            "groupchat_podcast.podcast.stitch_audio",
+            side_effect=lambda segments, output_path, pause_ms, silence: stitched.extend(p.read_bytes() for p in segments),
+        )
+        silence_sources = []
+        mocker.patch(
+            "groupchat_podcast.podcast._render_silence_like",
+            side_effect=lambda segment, path, pause_ms: silence_sources.append(segment.read_bytes()),
+        )
+        progress_calls = []
+
+        generator = PodcastGenerator(tts_client=mock_tts, voice_map={"_default": "voice"}, tts_concurrency=3)
+        generator.generate(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+            on_progress=lambda current, total, text: progress_calls.append((current, text)),
+        )
+
+        assert stitched == [b"First", b"Second", b"Third"]
+        assert progress_calls == [(1, "First"), (2, "Second"), (3, "Third")]
+        # The pause clip is rendered once, from the first segment, while later TTS calls run
+        assert silence_sources == [b"First"]
+
+    def test_silence_renders_while_tts_is_still_running(self, mocker, tmp_path):
+        """The pause clip starts rendering while later TTS requests still hold every worker."""
+        silence_started = threading.Event()
+        waited_for_silence = []
+
+        def generate(text, voice_id):
+            if text == "Second":
+                # Holds the only TTS worker until the silence render has begun
+                waited_for_silence.append(silence_started.wait(timeout=2))
+            return text.encode()
+
+        mock_tts = mocker.Mock()
+        mock_tts.generate.side_effect = generate
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender="Alice", text="First", timestamp=datetime(2024, 1, 15, 10, 0, 0), guid="1"),
+                Message(sender="Bob", text="Second", timestamp=datetime(2024, 1, 15, 10, 1, 0), guid="2"),
+            ],
+        )
+        mocker.patch("groupchat_podcast.podcast.stitch_audio")
+        mocker.patch(
+            "groupchat_podcast.podcast._render_silence_like",
+            side_effect=lambda segment, path, pause_ms: silence_started.set(),
+        )
+
+        generator = PodcastGenerator(tts_client=mock_tts, voice_map={"_default": "voice"}, tts_concurrency=1)
+        generator.generate(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+        )
+
+        assert waited_for_silence == [True]
+
+    def test_batches_same_voice_runs_when_client_supports_it(self, mocker, tmp_path):
+        """Clients with generate_batch get contiguous same-voice texts in batch_size groups."""
+        class BatchTTS:
+            def __init__(self):
+                self.calls = []
+
+            def generate_batch(self, texts, voice_ids):
+                self.calls.append((texts, voice_ids))
+                return [text.encode() for text in texts]
+
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender=sender, text=text, timestamp=datetime(2024, 1, 15, 10, minute, 0), guid=text)
+                for minute, (sender, text) in enumerate(
+                    [("Alice", "First"), ("Bob", "Second"), ("Alice", "Third"), ("Carol", "Fourth")]
+                )
+            ],
+        )
+        stitched = []
+        mocker.patch(
+            "groupchat_podcast.podcast.stitch_audio",
+            side_effect=lambda segments, output_path, pause_ms, silence: stitched.extend(p.read_bytes() for p in segments),
+        )
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+
+        tts = BatchTTS()
+        generator = PodcastGenerator(
+            tts_client=tts, voice_map={"_default": "narrator", "Carol": "carol"}, batch_size=2,
+        )
+        generator.generate(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+        )
+
+        assert sorted(tts.calls) == [
+            (["First", "Second"], ["narrator", "narrator"]),
+            (["Fourth"], ["carol"]),
+            (["Third"], ["narrator"]),
+        ]
+        assert stitched == [b"First", b"Second", b"Third", b"Fourth"]
+
+    def test_short_batch_response_raises_runtime_error(self, mocker, tmp_path):
+        """A generate_batch result with fewer clips than texts fails clearly instead of misaligning."""
+        class ShortBatchTTS:
+            def generate_batch(self, texts, voice_ids):
+                return [text.encode() for text in texts[:-1]]
+
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender=sender, text=text, timestamp=datetime(2024, 1, 15, 10, minute, 0), guid=text)
+                for minute, (sender, text) in enumerate([("Alice", "First"), ("Bob", "Second")])
+            ],
+        )
+        mocker.patch("groupchat_podcast.podcast.stitch_audio")
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+
+        generator = PodcastGenerator(tts_client=ShortBatchTTS(), voice_map={"_default": "voice"})
+        with pytest.raises(RuntimeError, match="returned 1 clips for 2 texts"):
+            generator.generate(
+                db_path=Path("/fake/path"),
+                chat_id=1,
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 31),
+                output_path=tmp_path / "podcast.mp3",
+            )
+
+    def test_generate_async_awaits_async_client_in_order(self, mocker, tmp_path):
+        """generate_async awaits async clients concurrently, capped at tts_concurrency, in message order."""
+        class AsyncTTS:
+            def __init__(self):
+                self.in_flight = 0
+                self.peak = 0
+
+            async def generate_async(self, text, voice_id):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                # Earlier messages take longer, so calls complete out of order
+                await asyncio.sleep(0.01 * (5 - int(text[-1])))
+                self.in_flight -= 1
+                return text.encode()
+
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender=f"S{i % 2}", text=f"Msg {i}", timestamp=datetime(2024, 1, 15, 10, i, 0), guid=str(i))
+                for i in range(5)
+            ],
+        )
+        stitched = []
+        mocker.patch(
+            "groupchat_podcast.podcast.stitch_audio",
+            side_effect=lambda segments, output_path, pause_ms, silence: stitched.extend(p.read_bytes() for p in segments),
+        )
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+
+        tts = AsyncTTS()
+        generator = PodcastGenerator(tts_client=tts, voice_map={"_default": "voice"}, tts_concurrency=2)
+        asyncio.run(generator.generate_async(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+        ))
+
+        assert stitched == [f"Msg {i}".encode() for i in range(5)]
+        assert tts.peak == 2
+
+    def test_generate_async_failure_leaves_no_tasks_behind(self, mocker, tmp_path):
+        """When a TTS call fails, pending TTS and silence tasks are cancelled and awaited."""
+        class FailingTTS:
+            async def generate_async(self, text, voice_id):
+                if text == "Second":
+                    raise RuntimeError("quota exceeded")
+                await asyncio.sleep(0 if text == "First" else 1)
+                return text.encode()
+
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender=sender, text=text, timestamp=datetime(2024, 1, 15, 10, minute, 0), guid=text)
+                for minute, (sender, text) in enumerate([("Alice", "First"), ("Bob", "Second"), ("Alice", "Third")])
+            ],
+        )
+        mocker.patch("groupchat_podcast.podcast.stitch_audio")
+        mocker.patch(
+            "groupchat_podcast.podcast._render_silence_like",
+            side_effect=lambda segment, path, pause_ms: time.sleep(0.1),
+        )
+        generator = PodcastGenerator(tts_client=FailingTTS(), voice_map={"_default": "voice"})
+
+        async def run():
+            with pytest.raises(RuntimeError, match="quota exceeded"):
+                await generator.generate_async(
+                    db_path=Path("/fake/path"),
+                    chat_id=1,
+                    start_date=datetime(2024, 1, 1),
+                    end_date=datetime(2024, 1, 31),
+                    output_path=tmp_path / "podcast.mp3",
+                )
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        assert asyncio.run(run()) == []
+
+    def test_generate_async_runs_sync_client_in_threads(self, mocker, tmp_path):
+        """Clients without generate_async still work through generate_async."""
+        mock_tts = mocker.Mock()
+        mock_tts.generate.side_effect = lambda text, voice_id: text.encode()
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender="Alice", text="First", timestamp=datetime(2024, 1, 15, 10, 0, 0), guid="1"),
+                Message(sender="Bob", text="Second", timestamp=datetime(2024, 1, 15, 10, 1, 0), guid="2"),
+            ],
+        )
+        stitched = []
+        mocker.patch(
+            "groupchat_podcast.podcast.stitch_audio",
+            side_effect=lambda segments, output_path, pause_ms, silence: stitched.extend(p.read_bytes() for p in segments),
+        )
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+
+        generator = PodcastGenerator(tts_client=mock_tts, voice_map={"_default": "voice"})
+        asyncio.run(generator.generate_async(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+        ))
+
+        assert stitched == [b"First", b"Second"]
+
     def test_estimates_cost(self, mocker, mock_chat_db):
         """Generator can estimate cost before generating."""
         generator = PodcastGenerator(
@@ -439,3 +841,128 @@ class TestPodcastGeneratorNoFfmpeg:
         assert "estimated_cost" in estimate
         assert estimate["characters"] > 0
         assert estimate["message_count"] > 0
+
+
+class TestTTSCache:
+    """Tests for the on-disk TTS audio cache."""
+
+    def test_returns_none_on_miss(self, tmp_path):
+        """Text that was never stored is a miss."""
+        cache = TTSCache(cache_dir=tmp_path)
+        assert cache.get("Hello", "voice-1") is None
+
+    def test_round_trips_audio_per_text_and_voice(self, tmp_path):
+        """Stored audio comes back for the same text and voice only."""
+        cache = TTSCache(cache_dir=tmp_path)
+        cache.put("Hello", "voice-1", b"hello-audio")
+
+        assert cache.get("Hello", "voice-1").read_bytes() == b"hello-audio"
+        assert cache.get("  Hello ", "voice-1").read_bytes() == b"hello-audio"
+        assert cache.get("Hello", "voice-2") is None
+        assert cache.get("HELLO", "voice-1") is None
+
+    def test_copy_to_writes_cached_audio_to_destination(self, tmp_path):
+        """copy_to copies a hit to the destination and reports a miss without writing."""
+        cache = TTSCache(cache_dir=tmp_path / "cache")
+        cache.put("Hello", "voice-1", b"hello-audio")
+
+        assert cache.copy_to("Hello", "voice-1", tmp_path / "hit.mp3")
+        assert (tmp_path / "hit.mp3").read_bytes() == b"hello-audio"
+        assert not cache.copy_to("Bye", "voice-1", tmp_path / "miss.mp3")
+        assert not (tmp_path / "miss.mp3").exists()
+
+    def test_evicts_least_recently_used_past_size_limit(self, tmp_path):
+        """Once over the size limit, the least recently used entries go first."""
+        cache = TTSCache(cache_dir=tmp_path, max_cache_mb=1)
+        clip = b"x" * (400 * 1024)
+        old = cache.put("old", "v", clip)
+        fresh = cache.put("fresh", "v", clip)
+        # Backdate "old" so the ordering doesn't depend on filesystem timestamp resolution
+        os.utime(old, (1, 1))
+        os.utime(fresh, (2, 2))
+
+        cache.put("newest", "v", clip)
+
+        assert cache.get("old", "v") is None
+        assert cache.get("fresh", "v") is not None
+        assert cache.get("newest", "v") is not None
+
+    def test_different_tts_settings_miss_the_cache(self, tmp_path, stub_elevenlabs):
+        """Audio cached under one model/format/voice-settings key isn't served for another."""
+        cache = TTSCache(cache_dir=tmp_path)
+        default_key = TTSClient(api_key="k").cache_key()
+        tuned_key = TTSClient(api_key="k", voice_settings={"stability": 0.4}).cache_key()
+        cache.put("Hello", "voice-1", b"default-audio", default_key)
+
+        assert tuned_key != default_key
+        assert cache.get("Hello", "voice-1", default_key).read_bytes() == b"default-audio"
+        assert cache.get("Hello", "voice-1", tuned_key) is None
+
+    def test_generator_keys_cache_by_client_settings(self, mocker, tmp_path, stub_elevenlabs):
+        """Changing the client's voice settings regenerates audio instead of reusing the cache."""
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[Message(sender="Alice", text="lol", timestamp=datetime(2024, 1, 15, 10, 0, 0), guid="1")],
+        )
+        mocker.patch("groupchat_podcast.podcast.stitch_audio")
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+        cache = TTSCache(cache_dir=tmp_path / "cache")
+
+        convert_calls = 0
+        for settings in (None, None, {"stability": 0.4}):
+            client = TTSClient(api_key="k", voice_settings=settings)
+            PodcastGenerator(tts_client=client, voice_map={"_default": "voice"}, tts_cache=cache).generate(
+                db_path=Path("/fake/path"),
+                chat_id=1,
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 31),
+                output_path=tmp_path / "podcast.mp3",
+            )
+            convert_calls += len(client._client.convert_calls)
+
+        assert convert_calls == 2
+
+    def test_put_scans_the_cache_directory_only_when_evicting(self, mocker, tmp_path):
+        """The size total is kept in memory, so puts below the limit don't rescan the directory."""
+        cache = TTSCache(cache_dir=tmp_path, max_cache_mb=1)
+        scan_spy = mocker.spy(cache, "_entries")
+
+        for i in range(5):
+            cache.put(f"clip {i}", "v", b"x" * (100 * 1024))
+        assert scan_spy.call_count == 1  # Seeding the total on first use
+
+        for i in range(5, 12):
+            cache.put(f"clip {i}", "v", b"x" * (100 * 1024))
+        assert scan_spy.call_count == 2  # One eviction, down below the limit
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.mp3")) <= 1024 * 1024
+
+    def test_generator_skips_tts_on_cache_hit(self, mocker, tmp_path):
+        """Repeated text/voice pairs are synthesized once and then served from the cache."""
+        mock_tts = mocker.Mock()
+        mock_tts.generate.return_value = b"audio"
+        mocker.patch(
+            "groupchat_podcast.podcast.extract_messages",
+            return_value=[
+                Message(sender="Alice", text="lol", timestamp=datetime(2024, 1, 15, 10, 0, 0), guid="1"),
+                Message(sender="Bob", text="ok", timestamp=datetime(2024, 1, 15, 10, 1, 0), guid="2"),
+                Message(sender="Alice", text="lol", timestamp=datetime(2024, 1, 15, 10, 2, 0), guid="3"),
+            ],
+        )
+        mocker.patch("groupchat_podcast.podcast.stitch_audio")
+        mocker.patch("groupchat_podcast.podcast._render_silence_like")
+
+        generator = PodcastGenerator(
+            tts_client=mock_tts,
+            voice_map={"_default": "voice"},
+            tts_concurrency=1,
+            tts_cache=TTSCache(cache_dir=tmp_path / "cache"),
+        )
+        generator.generate(
+            db_path=Path("/fake/path"),
+            chat_id=1,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 31),
+            output_path=tmp_path / "podcast.mp3",
+        )
+
+        assert mock_tts.generate.call_count == 2
@@ -1,13 +1,8 @@
 """Tests for preflight prerequisite checks."""
 
-import os
-from pathlib import Path
-from unittest.mock import patch
-
-import pytest
+from types import SimpleNamespace
 
 from groupchat_podcast.preflight import (
-    CheckResult,
     check_api_key,
     check_disk_access,
     check_ffmpeg,
@@ -18,37 +13,37 @@ from groupchat_podcast.preflight import (
 class TestCheckFfmpeg:
     """Tests for ffmpeg detection."""
 
-    def test_finds_ffmpeg_in_homebrew_path_when_not_on_PATH(self):
+    def test_finds_ffmpeg_in_homebrew_path_when_not_on_PATH(self, fake_homebrew_ffmpeg):
         """check_ffmpeg finds ffmpeg at /opt/homebrew/bin even if not on PATH."""
-        with patch("shutil.which", return_value=None), \
-             patch("os.path.isfile", side_effect=lambda p: p == "/opt/homebrew/bin/ffmpeg"), \
-             patch("os.access", return_value=True):
-            result = check_ffmpeg()
+        result = check_ffmpeg()
         assert result.passed is True
 
 
 class TestCheckDiskAccess:
     """Tests for Full Disk Access detection via file probing."""
 
-    def test_passes_when_db_readable(self, tmp_path):
+    def test_passes_when_db_readable(self, fake_db):
         """check_disk_access passes when the database file can be opened."""
-        db_file = tmp_path / "chat.db"
-        db_file.write_bytes(b"fake-db-content")
-        result = check_disk_access(db_file)
+        result = check_disk_access(fake_db)
         assert result.passed is True
 
-    def test_fails_with_fda_instructions_on_operation_not_permitted(self, tmp_path):
+    def test_fails_with_fda_instructions_on_operation_not_permitted(self, scratch_dir, monkeypatch):
         """check_disk_access fails with Full Disk Access instructions on PermissionError."""
-        db_file = tmp_path / "chat.db"
-        with patch("builtins.open", side_effect=PermissionError("Operation not permitted")):
-            result = check_disk_access(db_file)
+        db_file = scratch_dir / "chat.db"
+
+        def deny(*args, **kwargs):
+            raise PermissionError("Operation not permitted")
+
+        # Shadow open in preflight's globals only; builtins.open stays untouched
+        monkeypatch.setattr("groupchat_podcast.preflight.open", deny, raising=False)
+        result = check_disk_access(db_file)
         assert result.passed is False
         assert "Full Disk Access" in result.fix_instruction
         assert "System Settings" in result.fix_instruction
 
-    def test_fails_when_db_not_found(self, tmp_path):
+    def test_fails_when_db_not_found(self, scratch_dir):
         """check_disk_access fails with iMessage setup instructions when file missing."""
-        db_file = tmp_path / "nonexistent" / "chat.db"
+        db_file = scratch_dir / "nonexistent" / "chat.db"
         result = check_disk_access(db_file)
         assert result.passed is False
         assert "iMessage" in result.message or "Messages" in result.message
@@ -57,17 +52,15 @@ class TestCheckDiskAccess:
 class TestCheckApiKey:
     """Tests for ElevenLabs API key detection."""
 
-    def test_passes_when_key_in_environment(self):
+    def test_passes_when_key_in_environment(self, monkeypatch):
         """check_api_key passes when ELEVENLABS_API_KEY is set."""
-        with patch.dict(os.environ, {"ELEVENLABS_API_KEY": "sk-test-123"}):
-            result = check_api_key()
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "sk-test-123")
+        result = check_api_key()
         assert result.passed is True
 
-    def test_fails_when_key_missing(self):
+    def test_fails_when_key_missing(self, empty_env):
         """check_api_key fails with setup instructions when no key is found."""
-        with patch.dict(os.environ, {}, clear=True), \
-             patch("groupchat_podcast.preflight.load_dotenv"):
-            result = check_api_key()
+        result = check_api_key()
         assert result.passed is False
         assert result.fix_instruction is not None
         assert "elevenlabs.io" in result.fix_instruction.lower() or "ElevenLabs" in result.fix_instruction
@@ -76,27 +69,20 @@ class TestCheckApiKey:
 class TestRunPreflight:
     """Tests for the aggregate preflight runner."""
 
-    def test_returns_true_when_all_checks_pass(self, tmp_path, capsys):
+    def test_returns_true_when_all_checks_pass(self, fake_db, capsys, monkeypatch):
         """run_preflight returns True when every check passes."""
-        db_file = tmp_path / "chat.db"
-        db_file.write_bytes(b"fake")
-
-        with patch("groupchat_podcast.preflight.sys") as mock_sys, \
-             patch("shutil.which", return_value="/usr/local/bin/ffmpeg"), \
-             patch.dict(os.environ, {"ELEVENLABS_API_KEY": "sk-test"}):
-            mock_sys.platform = "darwin"
-            result = run_preflight(db_file)
+        # Swap preflight's sys reference only, leaving the real sys.platform alone
+        monkeypatch.setattr("groupchat_podcast.preflight.sys", SimpleNamespace(platform="darwin"))
+        monkeypatch.setattr("shutil.which", lambda cmd, *args, **kwargs: "/usr/local/bin/ffmpeg")
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "sk-test")
+        result = run_preflight(fake_db)
         assert result is True
 
-    def test_returns_false_when_any_check_fails(self, tmp_path):
+    def test_returns_false_when_any_check_fails(self, fake_db, monkeypatch):
         """run_preflight returns False and displays failures when a check fails."""
-        db_file = tmp_path / "chat.db"
-        db_file.write_bytes(b"fake")
-
-        with patch("groupchat_podcast.preflight.sys") as mock_sys, \
-             patch("shutil.which", return_value=None), \
-             patch("os.path.isfile", return_value=False), \
-             patch.dict(os.environ, {"ELEVENLABS_API_KEY": "sk-test"}):
-            mock_sys.platform = "darwin"
-            result = run_preflight(db_file)
+        monkeypatch.setattr("groupchat_podcast.preflight.sys", SimpleNamespace(platform="darwin"))
+        monkeypatch.setattr("shutil.which", lambda cmd, *args, **kwargs: None)
+        monkeypatch.setattr("os.path.isfile", lambda p: False)
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "sk-test")
+        result = run_preflight(fake_db)
         assert result is False
@@ -1,5 +1,7 @@
 """Tests for ElevenLabs TTS integration."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from groupchat_podcast.tts import TTSClient, Voice, preprocess_text_for_tts
@@ -8,60 +10,45 @@ from groupchat_podcast.tts import TTSClient, Voice, preprocess_text_for_tts
 class TestTTSClient:
     """Tests for the TTS client wrapper."""
 
-    def test_generate_returns_audio_bytes(self, mocker):
+    def test_generate_returns_audio_bytes(self, tts_client):
         """Generate audio from text returns bytes."""
-        # Mock the ElevenLabs client
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.return_value = b"fake audio bytes"
+        client, stub = tts_client
+        stub.audio = b"fake audio bytes"
 
-        client = TTSClient(api_key="test-key")
         result = client.generate("Hello world", voice_id="test-voice-id")
 
         assert isinstance(result, bytes)
         assert len(result) > 0
-        mock_client.text_to_speech.convert.assert_called_once()
+        assert len(stub.convert_calls) == 1
 
-    def test_generate_uses_correct_voice_id(self, mocker):
+    def test_generate_uses_correct_voice_id(self, tts_client):
         """Generate should use the specified voice ID."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.return_value = b"audio"
+        client, stub = tts_client
 
-        client = TTSClient(api_key="test-key")
         client.generate("Hello", voice_id="specific-voice-123")
 
-        call_kwargs = mock_client.text_to_speech.convert.call_args
-        assert call_kwargs.kwargs["voice_id"] == "specific-voice-123"
+        assert stub.convert_calls[-1]["voice_id"] == "specific-voice-123"
 
-    def test_generate_uses_correct_model(self, mocker):
+    def test_generate_uses_correct_model(self, tts_client):
         """Generate should use multilingual v2 model."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.return_value = b"audio"
+        client, stub = tts_client
 
-        client = TTSClient(api_key="test-key")
         client.generate("Hello", voice_id="voice-id")
 
-        call_kwargs = mock_client.text_to_speech.convert.call_args
-        assert call_kwargs.kwargs["model_id"] == "eleven_multilingual_v2"
+        assert stub.convert_calls[-1]["model_id"] == "eleven_multilingual_v2"
 
-    def test_search_voices_returns_voice_list(self, mocker):
+    def test_search_voices_returns_voice_list(self, tts_client):
         """Search voices returns list of Voice objects."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-
-        # Create mock voice objects
-        mock_voice = mocker.Mock()
-        mock_voice.voice_id = "voice-123"
-        mock_voice.name = "Rachel"
-        mock_voice.labels = {"accent": "american", "gender": "female"}
+        client, stub = tts_client
 
-        mock_response = mocker.Mock()
-        mock_response.voices = [mock_voice]
-        mock_client.voices.search.return_value = mock_response
+        stub.voices_found = [
+            SimpleNamespace(
+                voice_id="voice-123",
+                name="Rachel",
+                labels={"accent": "american", "gender": "female"},
+            )
+        ]
 
-        client = TTSClient(api_key="test-key")
         voices = client.search_voices("rachel")
 
         assert len(voices) == 1
@@ -69,46 +56,31 @@ class TestTTSClient:
         assert voices[0].voice_id == "voice-123"
         assert voices[0].name == "Rachel"
 
-    def test_search_voices_with_empty_query_passes_none(self, mocker):
+    def test_search_voices_with_empty_query_passes_none(self, tts_client):
         """Empty search query should pass None to API (returns all voices)."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-
-        mock_response = mocker.Mock()
-        mock_response.voices = []
-        mock_client.voices.search.return_value = mock_response
+        client, stub = tts_client
 
-        client = TTSClient(api_key="test-key")
         client.search_voices("")
 
         # Verify the API was called with search=None (not empty string)
-        mock_client.voices.search.assert_called_once_with(search=None)
+        assert stub.search_calls == [None]
 
-    def test_get_voice_by_id(self, mocker):
+    def test_get_voice_by_id(self, tts_client):
         """Get a specific voice by ID."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
+        client, stub = tts_client
 
-        mock_voice = mocker.Mock()
-        mock_voice.voice_id = "specific-id"
-        mock_voice.name = "Custom Voice"
-        mock_voice.labels = {}
-        mock_client.voices.get.return_value = mock_voice
+        stub.voice = SimpleNamespace(voice_id="specific-id", name="Custom Voice", labels={})
 
-        client = TTSClient(api_key="test-key")
         voice = client.get_voice("specific-id")
 
         assert voice.voice_id == "specific-id"
         assert voice.name == "Custom Voice"
-        mock_client.voices.get.assert_called_once_with("specific-id")
+        assert stub.get_calls == ["specific-id"]
 
-    def test_handles_api_error_gracefully(self, mocker):
+    def test_handles_api_error_gracefully(self, tts_client):
         """API errors should propagate with their original message."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.side_effect = Exception("Rate limit exceeded")
-
-        client = TTSClient(api_key="test-key")
+        client, stub = tts_client
+        stub.error = Exception("Rate limit exceeded")
 
         with pytest.raises(Exception) as exc_info:
             client.generate("Hello", voice_id="voice-id")
@@ -116,38 +88,36 @@ class TestTTSClient:
         # Verify the original error message is preserved
         assert "Rate limit exceeded" in str(exc_info.value)
 
-    def test_client_uses_provided_api_key(self, mocker):
+    def test_client_uses_provided_api_key(self, stub_elevenlabs):
         """Client should initialize with the provided API key."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
+        client = TTSClient(api_key="my-secret-key")
 
-        TTSClient(api_key="my-secret-key")
+        assert client._client.api_key == "my-secret-key"
 
-        mock_elevenlabs.assert_called_once_with(api_key="my-secret-key")
+    def test_sdk_client_is_built_on_first_use(self, stub_elevenlabs):
+        """Constructing a TTSClient should not build the SDK client until it is needed."""
+        client = TTSClient(api_key="test-key")
+        assert "_client" not in vars(client)
 
-    def test_generate_forwards_voice_settings(self, mocker):
-        """Voice settings from constructor should be passed to API."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.return_value = b"audio"
+        client.generate("Hello", voice_id="voice-id")
+
+        assert "_client" in vars(client)
 
+    def test_generate_forwards_voice_settings(self, stub_elevenlabs):
+        """Voice settings from constructor should be passed to API."""
         settings = {"stability": 0.4, "similarity_boost": 0.5, "style": 0.0}
         client = TTSClient(api_key="test-key", voice_settings=settings)
         client.generate("Hello", voice_id="voice-id")
 
-        call_kwargs = mock_client.text_to_speech.convert.call_args.kwargs
-        assert call_kwargs["voice_settings"] == settings
+        assert client._client.convert_calls[-1]["voice_settings"] == settings
 
-    def test_generate_without_voice_settings(self, mocker):
+    def test_generate_without_voice_settings(self, tts_client):
         """Without voice settings, API call should not include them."""
-        mock_elevenlabs = mocker.patch("groupchat_podcast.tts.ElevenLabs")
-        mock_client = mock_elevenlabs.return_value
-        mock_client.text_to_speech.convert.return_value = b"audio"
+        client, stub = tts_client
 
-        client = TTSClient(api_key="test-key")
         client.generate("Hello", voice_id="voice-id")
 
-        call_kwargs = mock_client.text_to_speech.convert.call_args.kwargs
-        assert "voice_settings" not in call_kwargs
+        assert "voice_settings" not in stub.convert_calls[-1]
 
 
 class TestPreprocessTextForTts:
@@ -161,48 +131,66 @@ class TestPreprocessTextForTts:
         assert "Hey" in result
         assert "how are you" in result
 
-    def test_expands_idk(self):
-        """idk should expand to I don't know."""
-        result = preprocess_text_for_tts("idk what to do")
-        assert "I don't know" in result
-        assert "idk" not in result.lower().split()
-
-    def test_expands_multiple_abbreviations(self):
-        """Multiple abbreviations in one message should all expand."""
-        result = preprocess_text_for_tts("btw lmk if you can come")
-        assert "by the way" in result
-        assert "let me know" in result
-
-    def test_expands_abbreviations_case_insensitive(self):
-        """Abbreviations should expand regardless of case."""
-        result = preprocess_text_for_tts("IDK man")
-        assert "I don't know" in result
-
-    def test_uppercases_tts_abbreviations(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("id😊k", "I don't know"),
+            ("😊idk😊 man", "I don't know man"),
+            ("century 😊bc", "century bc"),
+            ("2😊 bc", "2 bc"),
+            ("left 😊bc😊 bored", "left because bored"),
+            ("br😊b", "BRB"),
+            ("WH😊AT!😊!", "what!"),
+        ],
+    )
+    def test_strips_emojis_before_other_rules(self, text, expected):
+        """Emojis inside or next to words are removed before abbreviations and caps are handled."""
+        assert preprocess_text_for_tts(text) == expected
+
+    @pytest.mark.parametrize(
+        "text,must_contain,must_not_contain",
+        [
+            ("idk what to do", ["I don't know"], ["idk"]),
+            ("btw lmk if you can come", ["by the way", "let me know"], []),
+            ("IDK man", ["I don't know"], []),
+            ("pls help me", ["please"], []),
+            ("plz come over", ["please"], []),
+            ("I left bc it was boring", ["because"], []),
+            # "bc" stays after a number or "century"
+            ("that was like 300 bc", ["bc"], ["because"]),
+            ("the 3rd century bc was wild", ["bc"], ["because"]),
+        ],
+    )
+    def test_expands_abbreviations(self, text, must_contain, must_not_contain):
+        """Chat abbreviations expand case-insensitively, except bc after a number or century."""
+        result = preprocess_text_for_tts(text)
+        for phrase in must_contain:
+            assert phrase in result
+        for phrase in must_not_contain:
+            assert phrase not in result
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("brb going to store", "BRB"),
+            ("that's funny lmao", "LMAO"),
+            ("imo it's overrated", "IMO"),
+            ("that's annoying af", "AF"),
+        ],
+    )
+    def test_uppercases_tts_abbreviations(self, text, expected):
         """Abbreviations that TTS mispronounces should be uppercased."""
-        result = preprocess_text_for_tts("brb going to store")
-        assert "BRB" in result
-
-        result = preprocess_text_for_tts("that's funny lmao")
-        assert "LMAO" in result
-
-        result = preprocess_text_for_tts("imo it's overrated")
-        assert "IMO" in result
-
-        result = preprocess_text_for_tts("that's annoying af")
-        assert "AF" in result
-
-    def test_reduces_repeated_exclamation(self):
-        """Multiple exclamation marks should reduce to one."""
-        result = preprocess_text_for_tts("No way!!!")
-        assert "!!!" not in result
-        assert result.endswith("!")
-
-    def test_reduces_repeated_question_marks(self):
-        """Multiple question marks should reduce to one."""
-        result = preprocess_text_for_tts("Really???")
-        assert "???" not in result
-        assert result.endswith("?")
+        assert expected in preprocess_text_for_tts(text)
+
+    @pytest.mark.parametrize(
+        "text,repeated,mark",
+        [("No way!!!", "!!!", "!"), ("Really???", "???", "?")],
+    )
+    def test_reduces_repeated_punctuation(self, text, repeated, mark):
+        """Runs of exclamation or question marks should reduce to one."""
+        result = preprocess_text_for_tts(text)
+        assert repeated not in result
+        assert result.endswith(mark)
 
     def test_preserves_ellipsis(self):
         """Ellipsis should be preserved as it creates useful TTS hesitation."""
@@ -226,34 +214,20 @@ class TestPreprocessTextForTts:
         result = preprocess_text_for_tts(text)
         assert result == text
 
-    def test_bc_expanded_as_because(self):
-        """bc should expand to because in normal context."""
-        result = preprocess_text_for_tts("I left bc it was boring")
-        assert "because" in result
-
-    def test_bc_not_expanded_after_number(self):
-        """bc should not expand when preceded by a number (e.g. 300 bc)."""
-        result = preprocess_text_for_tts("that was like 300 bc")
-        assert "because" not in result
-        assert "bc" in result
-
-    def test_bc_not_expanded_after_century(self):
-        """bc should not expand after 'century'."""
-        result = preprocess_text_for_tts("the 3rd century bc was wild")
-        assert "because" not in result
-        assert "bc" in result
-
     def test_collapses_whitespace(self):
         """Multiple spaces should collapse to one, leading/trailing stripped."""
         result = preprocess_text_for_tts("  hey   how   are   you  ")
         assert result == "hey how are you"
 
-    def test_pls_expanded_to_please(self):
-        """pls and plz should expand to please."""
-        assert "please" in preprocess_text_for_tts("pls help me")
-        assert "please" in preprocess_text_for_tts("plz come over")
-
     def test_fr_does_not_expand_inside_words(self):
         """'fr' inside words like 'from' or 'friend' should not expand."""
         assert "from" in preprocess_text_for_tts("I'm coming from school")
         assert "friend" in preprocess_text_for_tts("She's my friend")
+
+    def test_repeated_text_is_served_from_cache(self):
+        """Preprocessing a message seen before reuses the memoized result."""
+        preprocess_text_for_tts.cache_clear()
+        first = preprocess_text_for_tts("idk lol!!!")
+        second = preprocess_text_for_tts("idk lol!!!")
+        assert first == second == "I don't know lol!"
+        assert preprocess_text_for_tts.cache_info().hits == 1